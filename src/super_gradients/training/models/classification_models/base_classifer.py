@@ -31,9 +31,12 @@ class BaseClassifier(SgModule):
         self._image_processor = image_processor or self._image_processor
 
     @lru_cache(maxsize=1)
-    def _get_pipeline(self, fuse_model: bool = True) -> ClassificationPipeline:
+    def _get_pipeline(self, fuse_model: bool = True, half_precision: bool = True, compile_model: bool = False, num_workers: int = 0) -> ClassificationPipeline:
         """Instantiate the prediction pipeline of this model.
         :param fuse_model: If True, create a copy of the model, and fuse some of its layers to increase performance. This increases memory usage.
+        :param half_precision: If True, run the model in mixed precision (FP16) when running on GPU. The outputs are cast back to FP32.
+        :param compile_model: If True, compile the model with `torch.compile` (requires torch>=2.0). The first predictions are slower due to compilation.
+        :param num_workers: Number of worker processes used to preprocess a list of images. If 0, the images are preprocessed in a background thread.
         """
         if None in (self._class_names, self._image_processor):
             raise RuntimeError(
@@ -45,21 +48,31 @@ class BaseClassifier(SgModule):
             image_processor=self._image_processor,
             class_names=self._class_names,
             fuse_model=fuse_model,
+            half_precision=half_precision,
+            compile_model=compile_model,
+            num_workers=num_workers,
         )
         return pipeline
 
-    def predict(self, images: ImageSource, fuse_model: bool = True) -> ImagesPredictions:
+    def predict(
+        self, images: ImageSource, fuse_model: bool = True, half_precision: bool = True, compile_model: bool = False, num_workers: int = 0
+    ) -> ImagesPredictions:
         """Predict an image or a list of images.
 
         :param images:  Images to predict.
         :param fuse_model: If True, create a copy of the model, and fuse some of its layers to increase performance. This increases memory usage.
+        :param half_precision: If True, run the model in mixed precision (FP16) when running on GPU. The outputs are cast back to FP32.
+        :param compile_model: If True, compile the model with `torch.compile` (requires torch>=2.0). The first predictions are slower due to compilation.
+        :param num_workers: Number of worker processes used to preprocess a list of images. If 0, the images are preprocessed in a background thread.
         """
-        pipeline = self._get_pipeline(fuse_model=fuse_model)
+        pipeline = self._get_pipeline(fuse_model=fuse_model, half_precision=half_precision, compile_model=compile_model, num_workers=num_workers)
         return pipeline(images)  # type: ignore
 
-    def predict_webcam(self, fuse_model: bool = True):
+    def predict_webcam(self, fuse_model: bool = True, half_precision: bool = True, compile_model: bool = False):
         """Predict using webcam.
         :param fuse_model: If True, create a copy of the model, and fuse some of its layers to increase performance. This increases memory usage.
+        :param half_precision: If True, run the model in mixed precision (FP16) when running on GPU. The outputs are cast back to FP32.
+        :param compile_model: If True, compile the model with `torch.compile` (requires torch>=2.0). The first predictions are slower due to compilation.
         """
-        pipeline = self._get_pipeline(fuse_model=fuse_model)
+        pipeline = self._get_pipeline(fuse_model=fuse_model, half_precision=half_precision, compile_model=compile_model)
         pipeline.predict_webcam()
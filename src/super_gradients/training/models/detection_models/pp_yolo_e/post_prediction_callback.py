@@ -1,9 +1,8 @@
 from typing import List
 
 import torch
-import torchvision
 
-from super_gradients.training.utils.detection_utils import DetectionPostPredictionCallback
+from super_gradients.training.utils.detection_utils import DetectionPostPredictionCallback, nms_per_image_and_class, split_predictions_per_image
 
 
 class PPYoloEPostPredictionCallback(DetectionPostPredictionCallback):
@@ -31,49 +30,68 @@ class PPYoloEPostPredictionCallback(DetectionPostPredictionCallback):
         :param device:
         :return:
         """
-        nms_result = []
         # First is model predictions, second element of tuple is logits for loss computation
-        predictions = outputs[0]
+        pred_bboxes, pred_scores = outputs[0]
+        # pred_bboxes [B, Anchors, 4],
+        # pred_scores [B, Anchors, C]
+        batch_size, num_classes = pred_scores.shape[0], pred_scores.shape[2]
+
+        # Filter all predictions by self.score_threshold. The predictions of all the images are gathered, to go through a single NMS call.
+        if self.multi_label_per_box:
+            pred_cls_conf = pred_scores.reshape(batch_size, -1)  # [B, Anchors * C]
+            candidates_mask = pred_cls_conf > self.score_threshold
+        else:
+            pred_cls_conf, pred_cls_label = torch.max(pred_scores, dim=2)  # [B, Anchors]
+            candidates_mask = pred_cls_conf >= self.score_threshold
+
+        image_idx, candidates_idx = candidates_mask.nonzero(as_tuple=True)
+        pred_cls_conf = pred_cls_conf[image_idx, candidates_idx]
+
+        # Filter all predictions by self.nms_top_k, in each image
+        n_candidates_per_image = torch.bincount(image_idx, minlength=batch_size)
+        if n_candidates_per_image.max() > self.nms_top_k:
+            topk_candidates = self._top_k_per_image(scores=pred_cls_conf, image_idx=image_idx, n_candidates_per_image=n_candidates_per_image)
+            image_idx, candidates_idx, pred_cls_conf = image_idx[topk_candidates], candidates_idx[topk_candidates], pred_cls_conf[topk_candidates]
+
+        if self.multi_label_per_box:
+            i, pred_cls_label = torch.div(candidates_idx, num_classes, rounding_mode="floor"), candidates_idx % num_classes
+        else:
+            i, pred_cls_label = candidates_idx, pred_cls_label[image_idx, candidates_idx]
+        pred_bboxes = pred_bboxes[image_idx, i, :]
+
+        # NMS
+        idx_to_keep = nms_per_image_and_class(
+            boxes=pred_bboxes, scores=pred_cls_conf, class_idx=pred_cls_label, image_idx=image_idx, iou_threshold=self.nms_threshold
+        )
+
+        pred_cls_conf = pred_cls_conf[idx_to_keep].unsqueeze(-1)
+        pred_cls_label = pred_cls_label[idx_to_keep].unsqueeze(-1)
+        pred_bboxes = pred_bboxes[idx_to_keep, :]
+
+        #  nx6 (x1, y1, x2, y2, confidence, class) in pixel units
+        final_boxes = torch.cat([pred_bboxes, pred_cls_conf, pred_cls_label], dim=1)  # [N,6]
+
+        nms_result = split_predictions_per_image(predictions=final_boxes, image_idx=image_idx[idx_to_keep], batch_size=batch_size)
 
-        for pred_bboxes, pred_scores in zip(*predictions):
-            # pred_bboxes [Anchors, 4],
-            # pred_scores [Anchors, C]
-
-            # Filter all predictions by self.score_threshold
-            if self.multi_label_per_box:
-                i, j = (pred_scores > self.score_threshold).nonzero(as_tuple=False).T
-                pred_bboxes = pred_bboxes[i]
-                pred_cls_conf = pred_scores[i, j]
-                pred_cls_label = j[:]
-
-            else:
-                pred_cls_conf, pred_cls_label = torch.max(pred_scores, dim=1)
-                conf_mask = pred_cls_conf >= self.score_threshold
-
-                pred_cls_conf = pred_cls_conf[conf_mask]
-                pred_cls_label = pred_cls_label[conf_mask]
-                pred_bboxes = pred_bboxes[conf_mask, :]
-
-            # Filter all predictions by self.nms_top_k
-            if pred_cls_conf.size(0) > self.nms_top_k:
-                topk_candidates = torch.topk(pred_cls_conf, k=self.nms_top_k, largest=True)
-                pred_cls_conf = pred_cls_conf[topk_candidates.indices]
-                pred_cls_label = pred_cls_label[topk_candidates.indices]
-                pred_bboxes = pred_bboxes[topk_candidates.indices, :]
-
-            # NMS
-            idx_to_keep = torchvision.ops.boxes.batched_nms(boxes=pred_bboxes, scores=pred_cls_conf, idxs=pred_cls_label, iou_threshold=self.nms_threshold)
-
-            pred_cls_conf = pred_cls_conf[idx_to_keep].unsqueeze(-1)
-            pred_cls_label = pred_cls_label[idx_to_keep].unsqueeze(-1)
-            pred_bboxes = pred_bboxes[idx_to_keep, :]
-
-            #  nx6 (x1, y1, x2, y2, confidence, class) in pixel units
-            final_boxes = torch.cat([pred_bboxes, pred_cls_conf, pred_cls_label], dim=1)  # [N,6]
+        return self._filter_max_predictions(nms_result)
 
-            nms_result.append(final_boxes)
+    def _top_k_per_image(self, scores: torch.Tensor, image_idx: torch.Tensor, n_candidates_per_image: torch.Tensor) -> torch.Tensor:
+        """Get the indexes of the self.nms_top_k highest scores of each image, with a single top-k call for the whole batch.
 
-        return self._filter_max_predictions(nms_result)
+        :param scores:                  Scores of the candidates of all the images. Shape [N]
+        :param image_idx:               Index of the image each candidate belongs to, in increasing order. Shape [N]
+        :param n_candidates_per_image:  Number of candidates of each image. Shape [B]
+        :return:                        Indexes of the candidates to keep.
+        """
+        # Scores of the candidates of each image, padded to the largest number of candidates. Shape [B, max(n_candidates_per_image)]
+        first_index_per_image = torch.cumsum(n_candidates_per_image, dim=0) - n_candidates_per_image
+        index_in_image = torch.arange(scores.shape[0], device=scores.device) - first_index_per_image[image_idx]
+        padded_scores = scores.new_full((n_candidates_per_image.shape[0], int(n_candidates_per_image.max())), float("-inf"))
+        padded_scores[image_idx, index_in_image] = scores
+
+        topk_candidates = torch.topk(padded_scores, k=self.nms_top_k, dim=1, largest=True)
+        image, k = (topk_candidates.indices < n_candidates_per_image[:, None]).nonzero(as_tuple=True)
+        return first_index_per_image[image] + topk_candidates.indices[image, k]
 
     def _filter_max_predictions(self, res: List) -> List:
         res[:] = [im[: self.max_predictions] if (im is not None and im.shape[0] > self.max_predictions) else im for im in res]
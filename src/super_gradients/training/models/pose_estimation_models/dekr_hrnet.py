@@ -573,12 +573,17 @@ class DEKRPoseEstimationModel(SgModule):
         self._default_nms_conf = conf or self._default_nms_conf
 
     @lru_cache(maxsize=1)
-    def _get_pipeline(self, conf: Optional[float] = None, fuse_model: bool = True) -> PoseEstimationPipeline:
+    def _get_pipeline(
+        self, conf: Optional[float] = None, fuse_model: bool = True, half_precision: bool = True, compile_model: bool = False, num_workers: int = 0
+    ) -> PoseEstimationPipeline:
         """Instantiate the prediction pipeline of this model.
 
         :param conf:    (Optional) Below the confidence threshold, prediction are discarded.
                         If None, the default value associated to the training is used.
         :param fuse_model: If True, create a copy of the model, and fuse some of its layers to increase performance. This increases memory usage.
+        :param half_precision: If True, run the model in mixed precision (FP16) when running on GPU. The outputs are cast back to FP32.
+        :param compile_model: If True, compile the model with `torch.compile` (requires torch>=2.0). The first predictions are slower due to compilation.
+        :param num_workers: Number of worker processes used to preprocess a list of images. If 0, the images are preprocessed in a background thread.
         """
         if None in (self._edge_links, self._image_processor, self._default_nms_conf):
             raise RuntimeError(
@@ -604,28 +609,44 @@ class DEKRPoseEstimationModel(SgModule):
             keypoint_colors=self._keypoint_colors,
             post_prediction_callback=self.get_post_prediction_callback(conf=conf),
             fuse_model=fuse_model,
+            half_precision=half_precision,
+            compile_model=compile_model,
+            num_workers=num_workers,
         )
         return pipeline
 
-    def predict(self, images: ImageSource, conf: Optional[float] = None, fuse_model: bool = True) -> ImagesPoseEstimationPrediction:
+    def predict(
+        self,
+        images: ImageSource,
+        conf: Optional[float] = None,
+        fuse_model: bool = True,
+        half_precision: bool = True,
+        compile_model: bool = False,
+        num_workers: int = 0,
+    ) -> ImagesPoseEstimationPrediction:
         """Predict an image or a list of images.
 
         :param images:  Images to predict.
         :param conf:    (Optional) Below the confidence threshold, prediction are discarded.
                         If None, the default value associated to the training is used.
         :param fuse_model: If True, create a copy of the model, and fuse some of its layers to increase performance. This increases memory usage.
+        :param half_precision: If True, run the model in mixed precision (FP16) when running on GPU. The outputs are cast back to FP32.
+        :param compile_model: If True, compile the model with `torch.compile` (requires torch>=2.0). The first predictions are slower due to compilation.
+        :param num_workers: Number of worker processes used to preprocess a list of images. If 0, the images are preprocessed in a background thread.
         """
-        pipeline = self._get_pipeline(conf=conf, fuse_model=fuse_model)
+        pipeline = self._get_pipeline(conf=conf, fuse_model=fuse_model, half_precision=half_precision, compile_model=compile_model, num_workers=num_workers)
         return pipeline(images)  # type: ignore
 
-    def predict_webcam(self, conf: Optional[float] = None, fuse_model: bool = True):
+    def predict_webcam(self, conf: Optional[float] = None, fuse_model: bool = True, half_precision: bool = True, compile_model: bool = False):
         """Predict using webcam.
 
         :param conf:    (Optional) Below the confidence threshold, prediction are discarded.
                         If None, the default value associated to the training is used.
         :param fuse_model: If True, create a copy of the model, and fuse some of its layers to increase performance. This increases memory usage.
+        :param half_precision: If True, run the model in mixed precision (FP16) when running on GPU. The outputs are cast back to FP32.
+        :param compile_model: If True, compile the model with `torch.compile` (requires torch>=2.0). The first predictions are slower due to compilation.
         """
-        pipeline = self._get_pipeline(conf=conf, fuse_model=fuse_model)
+        pipeline = self._get_pipeline(conf=conf, fuse_model=fuse_model, half_precision=half_precision, compile_model=compile_model)
         pipeline.predict_webcam()
 
     def train(self, mode: bool = True):
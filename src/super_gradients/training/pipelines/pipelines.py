@@ -1,11 +1,17 @@
 import copy
+import math
+import os
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple, Union, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Tuple, Union, Iterable, Iterator, Sequence
 from contextlib import contextmanager
 from tqdm import tqdm
 
 import numpy as np
 import torch
+from torch import nn
+from torch.utils.data import DataLoader, Dataset
 
 from super_gradients.training.utils.predict import (
     ImagePoseEstimationPrediction,
@@ -25,18 +31,123 @@ from super_gradients.training.utils.predict import (
     ClassificationPrediction,
 )
 from torch.nn.functional import softmax
-from super_gradients.training.utils.utils import generate_batch
-from super_gradients.training.utils.media.video import load_video, includes_video_extension
+from super_gradients.training.utils.utils import generate_batch, float_tensor_container_to_dtype
+from super_gradients.training.utils.media.video import stream_video, get_video_properties, includes_video_extension
 from super_gradients.training.utils.media.image import ImageSource, check_image_typing
 from super_gradients.training.utils.media.stream import WebcamStreaming
 from super_gradients.training.utils.detection_utils import DetectionPostPredictionCallback
 from super_gradients.training.models.sg_module import SgModule
-from super_gradients.training.processing.processing import Processing, ComposeProcessing
+from super_gradients.training.processing.processing import Processing, ComposeProcessing, GPUComposeProcessing, ProcessingMetadata
 from super_gradients.common.abstractions.abstract_logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class _PreprocessedBatch:
+    """Batch of images ready to be fed to the model.
+
+    :attr images:               Original images.
+    :attr model_inputs:         Preprocessed images, stacked into a single tensor. May still be in the process of being copied to the model device.
+    :attr processing_metadatas: Metadata of each image, required to postprocess the predictions.
+    :attr copy_event:           CUDA event recorded after the copy of `model_inputs` to the device, if it was done asynchronously.
+    """
+
+    images: List[np.ndarray]
+    model_inputs: torch.Tensor
+    processing_metadatas: List[Union[None, ProcessingMetadata]]
+    copy_event: Optional[torch.cuda.Event] = None
+
+
+class _StagingBuffers:
+    """Host buffers that the preprocessed batches are written into, reused across batches instead of allocating a new array for every batch.
+    The buffers are used in turns, so that a batch can be preprocessed while the model still runs on the previous one.
+    On CUDA, the buffers are allocated in pinned memory, so that they can be copied asynchronously to the device without an intermediate copy.
+    The buffers are created for each prediction call, so that concurrent calls on the same pipeline do not overwrite each other's batches,
+    and so that their memory is released when the call returns.
+
+    :param pin_memory:  If True, allocate the buffers in pinned memory.
+    :param n_buffers:   Number of buffers used in turns.
+    """
+
+    def __init__(self, pin_memory: bool, n_buffers: int = 2):
+        self.pin_memory = pin_memory
+        self._buffers: List[Optional[torch.Tensor]] = [None] * n_buffers
+        self._copy_events: List[Optional[torch.cuda.Event]] = [None] * n_buffers
+        self._next_index = 0
+
+    def next_buffer(self) -> Tuple[int, Optional[np.ndarray]]:
+        """Get the next buffer to write a batch into.
+
+        :return:
+            - Index of the buffer.
+            - Buffer, as a numpy array sharing its memory. None if it was not allocated yet.
+        """
+        buffer_index = self._next_index
+        self._next_index = (buffer_index + 1) % len(self._buffers)
+
+        copy_event = self._copy_events[buffer_index]
+        if copy_event is not None:
+            copy_event.synchronize()  # The previous batch must be fully copied to the device before the buffer is overwritten
+            self._copy_events[buffer_index] = None
+
+        buffer = self._buffers[buffer_index]
+        return buffer_index, (buffer.numpy() if buffer is not None else None)
+
+    def as_tensor(self, buffer_index: int, preprocessed_images: np.ndarray) -> torch.Tensor:
+        """Get the preprocessed images as a tensor. If they were not written into the buffer (e.g. the buffer was not allocated yet, or is too small),
+        the buffer is replaced by a new one fitting them, to be reused by the next batches.
+
+        :param buffer_index:        Index of the buffer returned by `next_buffer`.
+        :param preprocessed_images: Preprocessed images.
+        :return:                    Tensor sharing the memory of the buffer.
+        """
+        buffer = self._buffers[buffer_index]
+        if buffer is not None and np.may_share_memory(preprocessed_images, buffer.numpy()):
+            return buffer[: len(preprocessed_images)]
+
+        if self.pin_memory:
+            buffer = torch.from_numpy(preprocessed_images).pin_memory()
+        else:
+            buffer = torch.from_numpy(preprocessed_images)
+        self._buffers[buffer_index] = buffer
+        return buffer
+
+    def record_copy(self, buffer_index: int, copy_event: torch.cuda.Event) -> None:
+        """Register the CUDA event marking the end of the asynchronous copy of a buffer to the device.
+
+        :param buffer_index:    Index of the buffer that is copied.
+        :param copy_event:      CUDA event recorded after the copy.
+        """
+        self._copy_events[buffer_index] = copy_event
+
+
+class _PreprocessBatchesDataset(Dataset):
+    """Dataset returning preprocessed batches of images, used to preprocess the batches in DataLoader worker processes.
+
+    :param images:          Images to preprocess.
+    :param image_processor: Image processor used to preprocess the images.
+    :param batch_size:      Number of images in each batch.
+    """
+
+    def __init__(self, images: Sequence[np.ndarray], image_processor: Processing, batch_size: int):
+        self.images = images
+        self.image_processor = image_processor
+        self.batch_size = batch_size
+
+    def __len__(self) -> int:
+        return math.ceil(len(self.images) / self.batch_size)
+
+    def __getitem__(self, index: int) -> Tuple[torch.Tensor, List[Union[None, ProcessingMetadata]]]:
+        batch_images = self.images[index * self.batch_size : (index + 1) * self.batch_size]
+        preprocessed_images, processing_metadatas = self.image_processor.preprocess_images(batch_images)
+        return torch.from_numpy(preprocessed_images), processing_metadatas
+
+
+def _identity_collate_fn(batch):
+    return batch
+
+
 @contextmanager
 def eval_mode(model: SgModule) -> None:
     """Set a model in evaluation mode, undo at the end.
@@ -45,8 +156,10 @@ def eval_mode(model: SgModule) -> None:
     """
     _starting_mode = model.training
     model.eval()
-    yield
-    model.train(mode=_starting_mode)
+    try:
+        yield
+    finally:
+        model.train(mode=_starting_mode)
 
 
 class Pipeline(ABC):
@@ -57,6 +170,11 @@ class Pipeline(ABC):
     :param image_processor: A single image processor or a list of image processors for preprocessing and postprocessing the images.
     :param device:          The device on which the model will be run. If None, will run on current model device. Use "cuda" for GPU support.
     :param fuse_model:                  If True, create a copy of the model, and fuse some of its layers to increase performance. This increases memory usage.
+    :param half_precision:              If True, run the model in mixed precision (FP16) when running on GPU. The outputs are cast back to FP32.
+    :param compile_model:               If True, compile the model with `torch.compile` (requires torch>=2.0) in the first forward pass, specializing it
+                                        for the input shape. The first batches are slower because of the compilation.
+    :param num_workers:                 Number of worker processes used to preprocess the batches of a list of images. If 0, the batches are
+                                        preprocessed in a background thread of the main process instead.
     """
 
     def __init__(
@@ -66,24 +184,60 @@ class Pipeline(ABC):
         class_names: List[str],
         device: Optional[str] = None,
         fuse_model: bool = True,
+        half_precision: bool = True,
+        compile_model: bool = False,
+        num_workers: int = 0,
     ):
         self.device = device or next(model.parameters()).device
         self.model = model.to(self.device)
+        self._model_device = next(self.model.parameters()).device  # Resolved device, e.g. "cuda" -> "cuda:0"
         self.class_names = class_names
 
+        # Convolutions are faster on GPU with channels last (NHWC) memory layout, which matches the layout used by Tensor Cores.
+        # Only the copy of the model made when fusing it is converted, so that the user's model is never modified nor copied because of it.
+        self._supports_channels_last = self._model_device.type == "cuda" and any(isinstance(module, nn.Conv2d) for module in self.model.modules())
+        self._channels_last = False  # Set once the model copy was converted, from which point the inputs are converted as well
+
         if isinstance(image_processor, list):
             image_processor = ComposeProcessing(image_processor)
+        if self._model_device.type == "cuda" and type(image_processor) is ComposeProcessing:
+            # Run the pixel-wise processings on GPU, so that the images are copied to the device before being converted to float.
+            image_processor = GPUComposeProcessing(image_processor.processings)
         self.image_processor = image_processor
 
         self.fuse_model = fuse_model  # If True, the model will be fused in the first forward pass, to make sure it gets the right input_size
+        self.half_precision = half_precision
+        self.compile_model = compile_model  # If True, the model will be compiled in the first forward pass, after being fused
+        self.num_workers = num_workers
+        self._copy_stream: Optional[torch.cuda.Stream] = None  # Side CUDA stream used to copy the next batch while the model runs
+
+    def _ensure_model_on_device(self) -> None:
+        """Move the model back to the pipeline device if it was moved after init.
+        Only the first parameter is checked, to avoid going over all the parameters of the model on every call.
+        """
+        if next(self.model.parameters()).device != self._model_device:
+            self.model = self.model.to(self._model_device)
 
     def _fuse_model(self, input_example: torch.Tensor):
         logger.info("Fusing some of the model's layers. If this takes too much memory, you can deactivate it by setting `fuse_model=False`")
         self.model = copy.deepcopy(self.model)
         self.model.eval()
         self.model.prep_model_for_conversion(input_size=input_example.shape[-2:])
+        if self._supports_channels_last:
+            self.model = self.model.to(memory_format=torch.channels_last)  # After fusing, since fused layers are created with the default memory layout
+            self._channels_last = True
         self.fuse_model = False
 
+    def _compile_model(self):
+        self.compile_model = False
+        if not hasattr(torch, "compile"):
+            logger.warning(f"`compile_model=True` requires torch>=2.0, but torch=={torch.__version__} is installed. The model will not be compiled.")
+            return
+        logger.info("Compiling the model. The first forward passes will be slower. You can deactivate it by setting `compile_model=False`")
+        # "reduce-overhead" uses CUDA graphs, to remove the kernel launch overhead of every layer.
+        mode = "reduce-overhead" if self._model_device.type == "cuda" else "default"
+        self.model = torch.compile(self.model, mode=mode, dynamic=False)
+
     def __call__(self, inputs: Union[str, ImageSource, List[ImageSource]], batch_size: Optional[int] = 32) -> ImagesPredictions:
         """Predict an image or a list of images.
 
@@ -116,8 +270,9 @@ class Pipeline(ABC):
         from super_gradients.training.utils.media.image import load_images
 
         images = load_images(images)
-        result_generator = self._generate_prediction_result(images=images, batch_size=batch_size)
-        return self._combine_image_prediction_to_images(result_generator, n_images=len(images))
+        with eval_mode(self.model):  # Set once for the whole call rather than for every batch
+            result_generator = self._generate_prediction_result(images=images, batch_size=batch_size)
+            return self._combine_image_prediction_to_images(result_generator, n_images=len(images))
 
     def predict_video(self, video_path: str, batch_size: Optional[int] = 32) -> VideoPredictions:
         """Predict on a video file, by processing the frames in batches.
@@ -126,9 +281,11 @@ class Pipeline(ABC):
         :param batch_size:  The size of each batch.
         :return:            Results of the prediction.
         """
-        video_frames, fps = load_video(file_path=video_path)
-        result_generator = self._generate_prediction_result(images=video_frames, batch_size=batch_size)
-        return self._combine_image_prediction_to_video(result_generator, fps=fps, n_images=len(video_frames))
+        fps, n_frames = get_video_properties(file_path=video_path)
+        video_frames = stream_video(file_path=video_path)  # Frames are decoded in the background while the model runs
+        with eval_mode(self.model):  # Set once for the whole call rather than for every batch
+            result_generator = self._generate_prediction_result(images=video_frames, batch_size=batch_size)
+            return self._combine_image_prediction_to_video(result_generator, fps=fps, n_images=n_frames)
 
     def predict_webcam(self) -> None:
         """Predict using webcam"""
@@ -139,7 +296,8 @@ class Pipeline(ABC):
             return frame_prediction.draw()
 
         video_streaming = WebcamStreaming(frame_processing_fn=_draw_predictions, fps_update_frequency=1)
-        video_streaming.run()
+        with eval_mode(self.model):
+            video_streaming.run()
 
     def _generate_prediction_result(self, images: Iterable[np.ndarray], batch_size: Optional[int] = None) -> Iterable[ImagePrediction]:
         """Run the pipeline on the images as single batch or through multiple batches.
@@ -153,9 +311,41 @@ class Pipeline(ABC):
         """
         if batch_size is None:
             yield from self._generate_prediction_result_single_batch(images)
+        elif self.num_workers > 0 and isinstance(images, Sequence):
+            yield from self._generate_prediction_result_multiprocess(images, batch_size)
         else:
-            for batch_images in generate_batch(images, batch_size):
-                yield from self._generate_prediction_result_single_batch(batch_images)
+            batches = generate_batch(images, batch_size)
+            staging_buffers = _StagingBuffers(pin_memory=self._model_device.type == "cuda")
+            with ThreadPoolExecutor(max_workers=1) as executor, self._preprocess_executor(batch_size) as preprocess_executor:
+                # Preprocess the next batch in the background, while the model runs on the current one.
+                next_batch = executor.submit(self._preprocess_next_batch, batches, preprocess_executor, staging_buffers)
+                while True:
+                    preprocessed_batch = next_batch.result()
+                    if preprocessed_batch is None:
+                        break
+                    next_batch = executor.submit(self._preprocess_next_batch, batches, preprocess_executor, staging_buffers)
+                    yield from self._predict_preprocessed_batch(preprocessed_batch)
+
+    def _generate_prediction_result_multiprocess(self, images: Sequence[np.ndarray], batch_size: int) -> Iterable[ImagePrediction]:
+        """Run the pipeline on the images through multiple batches, preprocessing the batches in `self.num_workers` worker processes.
+        The batches are preprocessed ahead of the model, and are returned in order.
+
+        :param images:      Sequence of numpy arrays representing images.
+        :param batch_size:  The size of each batch.
+        :return:            Iterable of Results object, each containing the results of the prediction and the image.
+        """
+        dataset = _PreprocessBatchesDataset(images=images, image_processor=self.image_processor, batch_size=batch_size)
+        dataloader = DataLoader(
+            dataset,
+            batch_size=None,  # The dataset already returns full batches
+            num_workers=min(self.num_workers, len(dataset)),
+            pin_memory=self._model_device.type == "cuda",
+            collate_fn=_identity_collate_fn,
+        )
+        for batch_index, (model_inputs, processing_metadatas) in enumerate(dataloader):
+            batch_images = list(images[batch_index * batch_size : (batch_index + 1) * batch_size])
+            preprocessed_batch = self._start_copy_to_device(images=batch_images, model_inputs=model_inputs, processing_metadatas=processing_metadatas)
+            yield from self._predict_preprocessed_batch(preprocessed_batch)
 
     def _generate_prediction_result_single_batch(self, images: Iterable[np.ndarray]) -> Iterable[ImagePrediction]:
         """Run the pipeline on images. The pipeline is made of 4 steps:
@@ -168,31 +358,136 @@ class Pipeline(ABC):
         :return:        Iterable of Results object, each containing the results of the prediction and the image.
         """
         images = list(images)  # We need to load all the images into memory, and to reuse it afterwards.
-        self.model = self.model.to(self.device)  # Make sure the model is on the correct device, as it might have been moved after init
+        with self._preprocess_executor(len(images)) as preprocess_executor:
+            preprocessed_batch = self._preprocess_batch(images, preprocess_executor=preprocess_executor)
+        yield from self._predict_preprocessed_batch(preprocessed_batch)
+
+    def _preprocess_next_batch(
+        self,
+        batches: Iterator[Tuple[np.ndarray, ...]],
+        preprocess_executor: Optional[ThreadPoolExecutor] = None,
+        staging_buffers: Optional[_StagingBuffers] = None,
+    ) -> Optional[_PreprocessedBatch]:
+        """Preprocess the next batch of images, or return None if there is no batch left.
+
+        :param batches:             Iterator over the batches of images.
+        :param preprocess_executor: Optional thread pool used to preprocess the images of the batch in parallel.
+        :param staging_buffers:     Optional buffers to write the preprocessed batch into.
+        :return:                    Preprocessed batch, or None if there is no batch left.
+        """
+        batch_images = next(batches, None)
+        if batch_images is None:
+            return None
+        return self._preprocess_batch(batch_images, preprocess_executor=preprocess_executor, staging_buffers=staging_buffers)
+
+    def _preprocess_batch(
+        self,
+        images: Iterable[np.ndarray],
+        preprocess_executor: Optional[ThreadPoolExecutor] = None,
+        staging_buffers: Optional[_StagingBuffers] = None,
+    ) -> _PreprocessedBatch:
+        """Load and preprocess images, and start copying them to the model device.
+
+        This can be called from a background thread. On CUDA, the copy is issued asynchronously from pinned memory on a side stream,
+        so that it overlaps with the model running on the previous batch.
+
+        :param images:              Iterable of numpy arrays representing images.
+        :param preprocess_executor: Optional thread pool used to preprocess the images in parallel.
+        :param staging_buffers:     Optional buffers to write the preprocessed images into. If None, a new array is allocated.
+        :return:                    Preprocessed batch.
+        """
+        images = list(images)  # We need to load all the images into memory, and to reuse it afterwards.
+        if staging_buffers is None:
+            preprocessed_images, processing_metadatas = self.image_processor.preprocess_images(images, executor=preprocess_executor)
+            model_inputs = torch.from_numpy(preprocessed_images)
+            return self._start_copy_to_device(images=images, model_inputs=model_inputs, processing_metadatas=processing_metadatas)
+
+        buffer_index, buffer = staging_buffers.next_buffer()
+        preprocessed_images, processing_metadatas = self.image_processor.preprocess_images(images, out=buffer, executor=preprocess_executor)
+        model_inputs = staging_buffers.as_tensor(buffer_index=buffer_index, preprocessed_images=preprocessed_images)
+        preprocessed_batch = self._start_copy_to_device(images=images, model_inputs=model_inputs, processing_metadatas=processing_metadatas)
+        if preprocessed_batch.copy_event is not None:
+            staging_buffers.record_copy(buffer_index=buffer_index, copy_event=preprocessed_batch.copy_event)
+        return preprocessed_batch
+
+    @contextmanager
+    def _preprocess_executor(self, batch_size: int) -> Iterator[Optional[ThreadPoolExecutor]]:
+        """Create the thread pool used to preprocess the images of a batch in parallel, shut down when leaving the context.
+
+        :param batch_size:  Maximum number of images in a batch.
+        :return:            Thread pool, or None if the images would not be processed in parallel (single image, or single CPU).
+        """
+        max_workers = min(os.cpu_count() or 1, batch_size)
+        if max_workers <= 1:
+            yield None
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as preprocess_executor:
+                yield preprocess_executor
+
+    def _start_copy_to_device(
+        self, images: List[np.ndarray], model_inputs: torch.Tensor, processing_metadatas: List[Union[None, ProcessingMetadata]]
+    ) -> _PreprocessedBatch:
+        """Start copying preprocessed images to the model device. On CUDA, the copy is asynchronous.
+
+        :param images:                  Original images.
+        :param model_inputs:            Preprocessed images, stacked into a single CPU tensor.
+        :param processing_metadatas:    Metadata of each image, required to postprocess the predictions.
+        :return:                        Preprocessed batch.
+        """
+        copy_event = None
+        if self._model_device.type == "cuda":
+            if self._copy_stream is None:
+                self._copy_stream = torch.cuda.Stream(device=self._model_device)
+            with torch.cuda.stream(self._copy_stream):
+                if not model_inputs.is_pinned():
+                    model_inputs = model_inputs.pin_memory()
+                model_inputs = model_inputs.to(self._model_device, non_blocking=True)
+                copy_event = torch.cuda.Event()
+                copy_event.record(self._copy_stream)
+
+        return _PreprocessedBatch(images=images, model_inputs=model_inputs, processing_metadatas=processing_metadatas, copy_event=copy_event)
+
+    def _predict_preprocessed_batch(self, preprocessed_batch: _PreprocessedBatch) -> Iterable[ImagePrediction]:
+        """Run the model on a preprocessed batch, and postprocess its output.
+
+        :param preprocessed_batch:  Batch returned by `_preprocess_batch`.
+        :return:                    Iterable of Results object, each containing the results of the prediction and the image.
+        """
+        self._ensure_model_on_device()
 
-        # Preprocess
-        preprocessed_images, processing_metadatas = [], []
-        for image in images:
-            preprocessed_image, processing_metadata = self.image_processor.preprocess_image(image=image.copy())
-            preprocessed_images.append(preprocessed_image)
-            processing_metadatas.append(processing_metadata)
+        torch_inputs = preprocessed_batch.model_inputs
+        if preprocessed_batch.copy_event is not None:
+            # Wait for the copy to the device, and prevent the side stream from reusing the input memory while the model still uses it.
+            torch.cuda.current_stream(self._model_device).wait_event(preprocessed_batch.copy_event)
+            torch_inputs.record_stream(torch.cuda.current_stream(self._model_device))
 
         # Predict
-        with eval_mode(self.model), torch.no_grad(), torch.cuda.amp.autocast():
-            torch_inputs = torch.from_numpy(np.array(preprocessed_images)).to(self.device)
-            if self.fuse_model:
-                self._fuse_model(torch_inputs)
-            model_output = self.model(torch_inputs)
+        use_half_precision = self.half_precision and self._model_device.type == "cuda"
+        with torch.inference_mode():
+            with torch.cuda.amp.autocast(enabled=use_half_precision):
+                torch_inputs = torch_inputs.to(self._model_device)
+                if isinstance(self.image_processor, GPUComposeProcessing):
+                    torch_inputs = self.image_processor.preprocess_images_tensor(torch_inputs)
+                if self.fuse_model:
+                    self._fuse_model(torch_inputs)
+                # The device processings may return a permuted view of the batch, which is copied at most once, into the layout used by the model.
+                memory_format = torch.channels_last if self._channels_last and torch_inputs.ndim == 4 else torch.contiguous_format
+                torch_inputs = torch_inputs.contiguous(memory_format=memory_format)
+                if self.compile_model:
+                    self._compile_model()
+                model_output = self.model(torch_inputs)
+            if use_half_precision:
+                model_output = float_tensor_container_to_dtype(model_output, dtype=torch.float32)
             predictions = self._decode_model_output(model_output, model_input=torch_inputs)
 
         # Postprocess
         postprocessed_predictions = []
-        for image, prediction, processing_metadata in zip(images, predictions, processing_metadatas):
+        for prediction, processing_metadata in zip(predictions, preprocessed_batch.processing_metadatas):
             prediction = self.image_processor.postprocess_predictions(predictions=prediction, metadata=processing_metadata)
             postprocessed_predictions.append(prediction)
 
         # Yield results one by one
-        for image, prediction in zip(images, postprocessed_predictions):
+        for image, prediction in zip(preprocessed_batch.images, postprocessed_predictions):
             yield self._instantiate_image_prediction(image=image, prediction=prediction)
 
     @abstractmethod
@@ -249,6 +544,11 @@ class DetectionPipeline(Pipeline):
     :param image_processor:             Single image processor or a list of image processors for preprocessing and postprocessing the images.
     :param device:                      The device on which the model will be run. If None, will run on current model device. Use "cuda" for GPU support.
     :param fuse_model:                  If True, create a copy of the model, and fuse some of its layers to increase performance. This increases memory usage.
+    :param half_precision:              If True, run the model in mixed precision (FP16) when running on GPU. The outputs are cast back to FP32.
+    :param compile_model:               If True, compile the model with `torch.compile` (requires torch>=2.0) in the first forward pass, specializing it
+                                        for the input shape. The first batches are slower because of the compilation.
+    :param num_workers:                 Number of worker processes used to preprocess the batches of a list of images. If 0, the batches are
+                                        preprocessed in a background thread of the main process instead.
     """
 
     def __init__(
@@ -259,8 +559,20 @@ class DetectionPipeline(Pipeline):
         device: Optional[str] = None,
         image_processor: Optional[Processing] = None,
         fuse_model: bool = True,
+        half_precision: bool = True,
+        compile_model: bool = False,
+        num_workers: int = 0,
     ):
-        super().__init__(model=model, device=device, image_processor=image_processor, class_names=class_names, fuse_model=fuse_model)
+        super().__init__(
+            model=model,
+            device=device,
+            image_processor=image_processor,
+            class_names=class_names,
+            fuse_model=fuse_model,
+            half_precision=half_precision,
+            compile_model=compile_model,
+            num_workers=num_workers,
+        )
         self.post_prediction_callback = post_prediction_callback
 
     def _decode_model_output(self, model_output: Union[List, Tuple, torch.Tensor], model_input: np.ndarray) -> List[DetectionPrediction]:
@@ -272,15 +584,26 @@ class DetectionPipeline(Pipeline):
         """
         post_nms_predictions = self.post_prediction_callback(model_output, device=self.device)
 
+        # Move all the predictions of the batch to CPU at once, to synchronize with the device only once instead of once per image.
+        non_empty_predictions = [prediction for prediction in post_nms_predictions if prediction is not None]
+        if non_empty_predictions:
+            batch_predictions = torch.cat(non_empty_predictions).detach().cpu().numpy()
+        else:
+            batch_predictions = np.zeros((0, 6), dtype=np.float32)
+
+        # Split the columns once for the whole batch, each image then only takes a view of its rows.
+        batch_bboxes, batch_confidence, batch_labels = batch_predictions[:, :4], batch_predictions[:, 4], batch_predictions[:, 5]
+        n_predictions = [prediction.shape[0] if prediction is not None else 0 for prediction in post_nms_predictions]
+        end_indexes = np.cumsum(n_predictions)
+
         predictions = []
-        for prediction, image in zip(post_nms_predictions, model_input):
-            prediction = prediction if prediction is not None else torch.zeros((0, 6), dtype=torch.float32)
-            prediction = prediction.detach().cpu().numpy()
+        for image, end_index, n in zip(model_input, end_indexes, n_predictions):
+            start_index = end_index - n
             predictions.append(
                 DetectionPrediction(
-                    bboxes=prediction[:, :4],
-                    confidence=prediction[:, 4],
-                    labels=prediction[:, 5],
+                    bboxes=batch_bboxes[start_index:end_index],
+                    confidence=batch_confidence[start_index:end_index],
+                    labels=batch_labels[start_index:end_index],
                     bbox_format="xyxy",
                     image_shape=image.shape,
                 )
@@ -318,6 +641,11 @@ class PoseEstimationPipeline(Pipeline):
     :param image_processor:             Single image processor or a list of image processors for preprocessing and postprocessing the images.
     :param device:                      The device on which the model will be run. If None, will run on current model device. Use "cuda" for GPU support.
     :param fuse_model:                  If True, create a copy of the model, and fuse some of its layers to increase performance. This increases memory usage.
+    :param half_precision:              If True, run the model in mixed precision (FP16) when running on GPU. The outputs are cast back to FP32.
+    :param compile_model:               If True, compile the model with `torch.compile` (requires torch>=2.0) in the first forward pass, specializing it
+                                        for the input shape. The first batches are slower because of the compilation.
+    :param num_workers:                 Number of worker processes used to preprocess the batches of a list of images. If 0, the batches are
+                                        preprocessed in a background thread of the main process instead.
     """
 
     def __init__(
@@ -330,8 +658,20 @@ class PoseEstimationPipeline(Pipeline):
         device: Optional[str] = None,
         image_processor: Optional[Processing] = None,
         fuse_model: bool = True,
+        half_precision: bool = True,
+        compile_model: bool = False,
+        num_workers: int = 0,
     ):
-        super().__init__(model=model, device=device, image_processor=image_processor, class_names=None, fuse_model=fuse_model)
+        super().__init__(
+            model=model,
+            device=device,
+            image_processor=image_processor,
+            class_names=None,
+            fuse_model=fuse_model,
+            half_precision=half_precision,
+            compile_model=compile_model,
+            num_workers=num_workers,
+        )
         self.post_prediction_callback = post_prediction_callback
         self.edge_links = np.asarray(edge_links, dtype=int)
         self.edge_colors = np.asarray(edge_colors, dtype=int)
@@ -391,6 +731,11 @@ class ClassificationPipeline(Pipeline):
     :param image_processor:             Single image processor or a list of image processors for preprocessing and postprocessing the images.
     :param device:                      The device on which the model will be run. If None, will run on current model device. Use "cuda" for GPU support.
     :param fuse_model:                  If True, create a copy of the model, and fuse some of its layers to increase performance. This increases memory usage.
+    :param half_precision:              If True, run the model in mixed precision (FP16) when running on GPU. The outputs are cast back to FP32.
+    :param compile_model:               If True, compile the model with `torch.compile` (requires torch>=2.0) in the first forward pass, specializing it
+                                        for the input shape. The first batches are slower because of the compilation.
+    :param num_workers:                 Number of worker processes used to preprocess the batches of a list of images. If 0, the batches are
+                                        preprocessed in a background thread of the main process instead.
     """
 
     def __init__(
@@ -400,8 +745,20 @@ class ClassificationPipeline(Pipeline):
         device: Optional[str] = None,
         image_processor: Optional[Processing] = None,
         fuse_model: bool = True,
+        half_precision: bool = True,
+        compile_model: bool = False,
+        num_workers: int = 0,
     ):
-        super().__init__(model=model, device=device, image_processor=image_processor, class_names=class_names, fuse_model=fuse_model)
+        super().__init__(
+            model=model,
+            device=device,
+            image_processor=image_processor,
+            class_names=class_names,
+            fuse_model=fuse_model,
+            half_precision=half_precision,
+            compile_model=compile_model,
+            num_workers=num_workers,
+        )
 
     def _decode_model_output(self, model_output: Union[List, Tuple, torch.Tensor], model_input: np.ndarray) -> List[ClassificationPrediction]:
         """Decode the model output
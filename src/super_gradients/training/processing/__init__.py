@@ -8,6 +8,7 @@ from .processing import (
     ReverseImageChannels,
     NormalizeImage,
     ComposeProcessing,
+    GPUComposeProcessing,
 )
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     "ReverseImageChannels",
     "NormalizeImage",
     "ComposeProcessing",
+    "GPUComposeProcessing",
 ]
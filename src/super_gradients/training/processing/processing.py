@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Tuple, List, Union
+from concurrent.futures import Executor
+from typing import Tuple, List, Union, Iterable, Dict, Optional
 
+import cv2
 import numpy as np
+import torch
 from PIL import Image
 
 from super_gradients.common.object_names import Processings
@@ -50,8 +53,12 @@ class Processing(ABC):
 
     Subclasses should implement the `preprocess_image` and `postprocess_predictions`
     methods according to the specific requirements of the model and task.
+
+    Input images are not copied before being processed, so a subclass that modifies the input image in-place should set `mutates_input` to True.
     """
 
+    mutates_input: bool = False
+
     @abstractmethod
     def preprocess_image(self, image: np.ndarray) -> Tuple[np.ndarray, Union[None, ProcessingMetadata]]:
         """Processing an image, before feeding it to the network. Expected to be in (H, W, C) or (H, W)."""
@@ -62,6 +69,61 @@ class Processing(ABC):
         """Postprocess the model output predictions."""
         pass
 
+    def preprocess_images(
+        self, images: Iterable[np.ndarray], out: Optional[np.ndarray] = None, executor: Optional[Executor] = None
+    ) -> Tuple[np.ndarray, List[Union[None, ProcessingMetadata]]]:
+        """Processing a batch of images, before feeding it to the network.
+        Each processed image is written directly into a preallocated batch array, so all the processed images must share the same shape.
+
+        :param images:      Images to process, each in (H, W, C) or (H, W).
+        :param out:         Optional array to write the processed images into, to avoid allocating a new one for every batch.
+                            It is only used if its dtype and shape fit the processed images (it can hold more images than the batch).
+        :param executor:    Optional executor used to process the images in parallel. The first image is always processed first, on its own,
+                            to allocate the batch array. Thread executors are a good fit since OpenCV and most of NumPy release the GIL.
+        :return:
+            - Batch of processed images, stacked along the first axis. This is a view of `out` if it was used.
+            - Metadata of each image, in the same order as the images.
+        """
+        images = list(images)
+        if len(images) == 0:
+            raise ValueError("Cannot preprocess an empty batch of images.")
+
+        processed_image, metadata = self.preprocess_image(image=images[0])
+        if out is not None and out.dtype == processed_image.dtype and out.shape[1:] == processed_image.shape and len(out) >= len(images):
+            processed_images = out[: len(images)]
+        else:
+            processed_images = np.empty((len(images), *processed_image.shape), dtype=processed_image.dtype)
+        processed_images[0] = processed_image
+
+        def _preprocess_into_batch(index: int, image: np.ndarray) -> Union[None, ProcessingMetadata]:
+            processed_image, metadata = self.preprocess_image(image=image)
+            if processed_image.shape != processed_images.shape[1:]:
+                raise ValueError(f"All the processed images of a batch must have the same shape, got {processed_image.shape} and {processed_images.shape[1:]}.")
+            processed_images[index] = processed_image
+            return metadata
+
+        indexes = range(1, len(images))
+        if executor is not None and len(images) > 1:
+            metadata_lst = [metadata, *executor.map(_preprocess_into_batch, indexes, images[1:])]
+        else:
+            metadata_lst = [metadata, *map(_preprocess_into_batch, indexes, images[1:])]
+
+        return processed_images, metadata_lst
+
+
+class _TensorCompatibleProcessing(Processing, ABC):
+    """Processing that neither depends on the image shape nor produces metadata.
+    Such processing can also be applied at once to a batch of images stacked into a tensor, which can be on GPU.
+    """
+
+    @abstractmethod
+    def preprocess_images_tensor(self, images: torch.Tensor) -> torch.Tensor:
+        """Processing a batch of images stacked into a tensor, in (N, H, W, C) or (N, H, W) if not permuted yet."""
+        pass
+
+    def postprocess_predictions(self, predictions: Prediction, metadata: None) -> Prediction:
+        return predictions
+
 
 @register_processing(Processings.ComposeProcessing)
 class ComposeProcessing(Processing):
@@ -69,15 +131,54 @@ class ComposeProcessing(Processing):
 
     def __init__(self, processings: List[Processing]):
         self.processings = processings
+        self.mutates_input = any(processing.mutates_input for processing in processings)
+        self._pixel_value_runs = _get_pixel_value_runs(processings)
+        self._lookup_tables = {}  # Lookup tables fusing each run of pixel value processings (or None if not fusable), by (run start index, number of channels)
 
     def preprocess_image(self, image: np.ndarray) -> Tuple[np.ndarray, ComposeProcessingMetadata]:
-        """Processing an image, before feeding it to the network."""
-        processed_image, metadata_lst = image.copy(), []
-        for processing in self.processings:
-            processed_image, metadata = processing.preprocess_image(image=processed_image)
-            metadata_lst.append(metadata)
+        """Processing an image, before feeding it to the network.
+        Consecutive pixel value processings applied to an uint8 image are fused into a single lookup table, computed once for the 256 possible values.
+        """
+        processed_image, metadata_lst = (image.copy() if self.mutates_input else image), []
+        index = 0
+        while index < len(self.processings):
+            run_length = self._pixel_value_runs.get(index, 0)
+            lookup_table = None
+            if run_length > 0 and processed_image.dtype == np.uint8 and processed_image.ndim == 3:
+                lookup_table = self._get_lookup_table(run_start=index, run_length=run_length, n_channels=processed_image.shape[2])
+            if lookup_table is not None:
+                processed_image = cv2.LUT(np.ascontiguousarray(processed_image), lookup_table)
+                metadata_lst += [None] * run_length
+                index += run_length
+            else:
+                processed_image, metadata = self.processings[index].preprocess_image(image=processed_image)
+                metadata_lst.append(metadata)
+                index += 1
         return processed_image, ComposeProcessingMetadata(metadata_lst=metadata_lst)
 
+    def _get_lookup_table(self, run_start: int, run_length: int, n_channels: int) -> Optional[np.ndarray]:
+        """Get the lookup table mapping every uint8 value of every channel to its value after a run of pixel value processings.
+
+        :param run_start:   Index of the first processing of the run.
+        :param run_length:  Number of processings in the run.
+        :param n_channels:  Number of channels of the image.
+        :return:            Lookup table of shape (256, 1, n_channels), as expected by cv2.LUT.
+                            None if cv2.LUT would not give the same output as the processings, in which case they should be applied one by one.
+        """
+        key = (run_start, n_channels)
+        if key not in self._lookup_tables:
+            # Image of shape (256, 1, C) holding all the possible values, for each channel.
+            lookup_table = np.repeat(np.arange(256, dtype=np.uint8).reshape(256, 1, 1), n_channels, axis=2)
+            for processing in self.processings[run_start : run_start + run_length]:
+                lookup_table, _ = processing.preprocess_image(image=lookup_table)
+            # cv2.LUT drops the channel dimension of (H, W, 1) images, and can not change the number of channels
+            # (e.g. when a 3 channels normalization is broadcast over a single channel image).
+            if n_channels > 1 and lookup_table.shape == (256, 1, n_channels):
+                self._lookup_tables[key] = np.ascontiguousarray(lookup_table)
+            else:
+                self._lookup_tables[key] = None
+        return self._lookup_tables[key]
+
     def postprocess_predictions(self, predictions: Prediction, metadata: ComposeProcessingMetadata) -> Prediction:
         """Postprocess the model output predictions."""
         postprocessed_predictions = predictions
@@ -86,8 +187,54 @@ class ComposeProcessing(Processing):
         return postprocessed_predictions
 
 
+class GPUComposeProcessing(ComposeProcessing):
+    """Compose a list of Processing objects, running the tensor compatible processings found at the end of the list on the model device.
+
+    The leading processings are applied on CPU image by image, producing a batch that is usually still uint8, and therefore 4 times lighter to
+    copy to the device than the float32 model input. The trailing processings are then applied on the whole batch at once with torch operations,
+    by calling `preprocess_images_tensor` on the batch once it was moved to the device.
+
+    :param processings: List of processings.
+    """
+
+    def __init__(self, processings: List[Processing]):
+        super().__init__(processings=processings)
+        n_host_processings = len(processings)
+        while n_host_processings > 0 and isinstance(processings[n_host_processings - 1], _TensorCompatibleProcessing):
+            n_host_processings -= 1
+        self.host_processing = ComposeProcessing(processings[:n_host_processings])
+        self.device_processings = processings[n_host_processings:]
+
+    def preprocess_images(
+        self, images: Iterable[np.ndarray], out: Optional[np.ndarray] = None, executor: Optional[Executor] = None
+    ) -> Tuple[np.ndarray, List[ComposeProcessingMetadata]]:
+        """Processing a batch of images with the CPU processings only. The output should then be moved to the device and fed to `preprocess_images_tensor`.
+
+        :param images:      Images to process, each in (H, W, C) or (H, W).
+        :param out:         Optional array to write the processed images into, to avoid allocating a new one for every batch.
+        :param executor:    Optional executor used to process the images in parallel.
+        :return:
+            - Batch of images processed by the CPU processings, stacked along the first axis.
+            - Metadata of each image, in the same order as the images.
+        """
+        processed_images, host_metadata_lst = self.host_processing.preprocess_images(images, out=out, executor=executor)
+        device_metadata_lst = [None] * len(self.device_processings)
+        metadata_lst = [ComposeProcessingMetadata(metadata_lst=metadata.metadata_lst + device_metadata_lst) for metadata in host_metadata_lst]
+        return processed_images, metadata_lst
+
+    def preprocess_images_tensor(self, images: torch.Tensor) -> torch.Tensor:
+        """Apply the trailing tensor compatible processings on a batch of images, on the device of the batch.
+
+        :param images:  Batch of images returned by `preprocess_images`, moved to the target device.
+        :return:        Batch of processed images, ready to be fed to the network.
+        """
+        for processing in self.device_processings:
+            images = processing.preprocess_images_tensor(images)
+        return images
+
+
 @register_processing(Processings.ImagePermute)
-class ImagePermute(Processing):
+class ImagePermute(_TensorCompatibleProcessing):
     """Permute the image dimensions.
 
     :param permutation: Specify new order of dims. Default value (2, 0, 1) suitable for converting from HWC to CHW format.
@@ -100,12 +247,13 @@ class ImagePermute(Processing):
         processed_image = np.ascontiguousarray(image.transpose(*self.permutation))
         return processed_image, None
 
-    def postprocess_predictions(self, predictions: Prediction, metadata: None) -> Prediction:
-        return predictions
+    def preprocess_images_tensor(self, images: torch.Tensor) -> torch.Tensor:
+        batch_permutation = (0, *(dim + 1 for dim in self.permutation))
+        return images.permute(*batch_permutation)  # Returned as a view, the memory layout of the model input is set by the pipeline
 
 
 @register_processing(Processings.ReverseImageChannels)
-class ReverseImageChannels(Processing):
+class ReverseImageChannels(_TensorCompatibleProcessing):
     """Reverse the order of the image channels (RGB -> BGR or BGR -> RGB)."""
 
     def preprocess_image(self, image: np.ndarray) -> Tuple[np.ndarray, None]:
@@ -121,12 +269,14 @@ class ReverseImageChannels(Processing):
         processed_image = image[..., ::-1]
         return processed_image, None
 
-    def postprocess_predictions(self, predictions: Prediction, metadata: None) -> Prediction:
-        return predictions
+    def preprocess_images_tensor(self, images: torch.Tensor) -> torch.Tensor:
+        if images.shape[-1] != 3:
+            raise ValueError("ReverseImageChannels expects 3 channels, got: " + str(images.shape[-1]))
+        return images.flip(-1)
 
 
 @register_processing(Processings.StandardizeImage)
-class StandardizeImage(Processing):
+class StandardizeImage(_TensorCompatibleProcessing):
     """Standardize image pixel values with img/max_val
 
     :param max_value: Current maximum value of the image pixels. (usually 255)
@@ -145,12 +295,12 @@ class StandardizeImage(Processing):
         processed_image = (image / self.max_value).astype(np.float32)
         return processed_image, None
 
-    def postprocess_predictions(self, predictions: Prediction, metadata: None) -> Prediction:
-        return predictions
+    def preprocess_images_tensor(self, images: torch.Tensor) -> torch.Tensor:
+        return images.to(torch.float32) / self.max_value
 
 
 @register_processing(Processings.NormalizeImage)
-class NormalizeImage(Processing):
+class NormalizeImage(_TensorCompatibleProcessing):
     """Normalize an image based on means and standard deviation.
 
     :param mean:    Mean values for each channel.
@@ -160,12 +310,16 @@ class NormalizeImage(Processing):
     def __init__(self, mean: List[float], std: List[float]):
         self.mean = np.array(mean).reshape((1, 1, -1)).astype(np.float32)
         self.std = np.array(std).reshape((1, 1, -1)).astype(np.float32)
+        self._device_mean_std: Optional[Tuple[torch.Tensor, torch.Tensor]] = None  # Mean and std on the device of the last batch, copied only once
 
     def preprocess_image(self, image: np.ndarray) -> Tuple[np.ndarray, None]:
         return (image - self.mean) / self.std, None
 
-    def postprocess_predictions(self, predictions: Prediction, metadata: None) -> Prediction:
-        return predictions
+    def preprocess_images_tensor(self, images: torch.Tensor) -> torch.Tensor:
+        if self._device_mean_std is None or self._device_mean_std[0].device != images.device:
+            self._device_mean_std = torch.from_numpy(self.mean).to(images.device), torch.from_numpy(self.std).to(images.device)
+        mean, std = self._device_mean_std
+        return (images - mean) / std
 
 
 class _DetectionPadding(Processing, ABC):
@@ -357,6 +511,23 @@ class CenterCrop(ClassificationProcess):
         return cropped_image, None
 
 
+def _get_pixel_value_runs(processings: List[Processing]) -> Dict[int, int]:
+    """Find the runs of consecutive processings that only map each pixel value independently, per channel (i.e. standardization and normalization).
+
+    :param processings: List of processings.
+    :return:            Length of each run, by index of the first processing of the run.
+    """
+    runs = {}
+    run_start = None
+    for index, processing in enumerate([*processings, None]):
+        if isinstance(processing, (StandardizeImage, NormalizeImage)):
+            run_start = index if run_start is None else run_start
+        elif run_start is not None:
+            runs[run_start] = index - run_start
+            run_start = None
+    return runs
+
+
 def default_yolox_coco_processing_params() -> dict:
     """Processing parameters commonly used for training YoloX on COCO dataset.
     TODO: remove once we load it from the checkpoint
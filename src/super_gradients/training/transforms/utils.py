@@ -98,6 +98,18 @@ def _pad_image(image: np.ndarray, padding_coordinates: PaddingCoordinates, pad_v
     :param pad_value:   Padding value
     :return:            Image shifted according to padding coordinates.
     """
+    if _can_pad_with_opencv(image, pad_value):
+        # OpenCV copies the image and fills the borders in a single SIMD optimized call, which is faster than np.pad.
+        return cv2.copyMakeBorder(
+            image,
+            top=padding_coordinates.top,
+            bottom=padding_coordinates.bottom,
+            left=padding_coordinates.left,
+            right=padding_coordinates.right,
+            borderType=cv2.BORDER_CONSTANT,
+            value=(pad_value,) * 4,  # A scalar value would only be applied to the first channel
+        )
+
     pad_h = (padding_coordinates.top, padding_coordinates.bottom)
     pad_w = (padding_coordinates.left, padding_coordinates.right)
 
@@ -107,6 +119,19 @@ def _pad_image(image: np.ndarray, padding_coordinates: PaddingCoordinates, pad_v
         return np.pad(image, (pad_h, pad_w), "constant", constant_values=pad_value)
 
 
+def _can_pad_with_opencv(image: np.ndarray, pad_value: int) -> bool:
+    """Check if an image can be padded with cv2.copyMakeBorder, while giving the same output as np.pad.
+
+    :param image:       Image to pad. (H, W, C) or (H, W).
+    :param pad_value:   Padding value
+    :return:            True if the image can be padded with OpenCV.
+    """
+    supported_dtype = image.dtype in (np.uint8, np.int8, np.uint16, np.int16, np.int32, np.float32, np.float64)
+    # OpenCV drops the channel dimension of (H, W, 1) images, and only supports fill values of up to 4 channels.
+    supported_shape = image.ndim == 2 or (image.ndim == 3 and 2 <= image.shape[2] <= 4)
+    return supported_dtype and supported_shape and np.isscalar(pad_value)
+
+
 def _shift_bboxes(targets: np.array, shift_w: float, shift_h: float) -> np.array:
     """Shift bboxes with respect to padding values.
 
@@ -255,39 +255,83 @@ def non_max_suppression(prediction, conf_thres=0.1, iou_thres=0.6, multi_label_p
                                 usually valid for Yolo models only.
         :return: detections with shape nx6 (x1, y1, x2, y2, object_conf, class_conf, class)
     """
-    candidates_above_thres = prediction[..., 4] > conf_thres  # filter by confidence
-    output = [None] * prediction.shape[0]
-
-    for image_idx, pred in enumerate(prediction):
-
-        pred = pred[candidates_above_thres[image_idx]]  # confident
-
-        if not pred.shape[0]:  # If none remain process next image
-            continue
+    # The candidates of all the images are gathered, so that the whole batch goes through a single NMS call.
+    image_idx, anchor_idx = (prediction[..., 4] > conf_thres).nonzero(as_tuple=True)  # filter by confidence
+    pred = prediction[image_idx, anchor_idx]
+
+    if with_confidence:
+        pred[:, 5:] *= pred[:, 4:5]  # multiply objectness score with class score
+
+    box = convert_cxcywh_bbox_to_xyxy(pred[:, :4])  # cxcywh to xyxy
+
+    # Detections matrix nx6 (xyxy, conf, cls)
+    if multi_label_per_box:  # try for all good confidence classes
+        i, j = (pred[:, 5:] > conf_thres).nonzero(as_tuple=False).T
+        pred = torch.cat((box[i], pred[i, j + 5, None], j[:, None].float()), 1)
+        image_idx = image_idx[i]
+
+    else:  # best class only
+        conf, j = pred[:, 5:].max(1, keepdim=True)
+        conf_mask = conf.view(-1) > conf_thres
+        pred = torch.cat((box, conf, j.float()), 1)[conf_mask]
+        image_idx, j = image_idx[conf_mask], j.view(-1)[conf_mask]
+
+    idx_to_keep = nms_per_image_and_class(boxes=pred[:, :4], scores=pred[:, 4], class_idx=j.view(-1), image_idx=image_idx, iou_threshold=iou_thres)
+    output = split_predictions_per_image(predictions=pred[idx_to_keep], image_idx=image_idx[idx_to_keep], batch_size=prediction.shape[0])
+
+    # Images without any remaining prediction are represented by None
+    return [image_pred if image_pred.shape[0] else None for image_pred in output]
+
+
+def nms_per_image_and_class(boxes: torch.Tensor, scores: torch.Tensor, class_idx: torch.Tensor, image_idx: torch.Tensor, iou_threshold: float) -> torch.Tensor:
+    """Apply NMS independently on the boxes of each (image, class) pair of a batch.
+    The boxes of each class are shifted along the x axis, and the boxes of each image along the y axis, so that boxes of different pairs never overlap.
+    This allows to run NMS on the boxes of all the images with a single call, while keeping the offsets as small as torchvision's `batched_nms` on a
+    single image. Since the cost of a single NMS call grows quadratically with the number of boxes, large batches of boxes are still processed
+    image by image, with torchvision's `batched_nms`.
+
+    :param boxes:           Boxes of all the images, in (x1, y1, x2, y2) format. Shape [N, 4]
+    :param scores:          Score of each box. Shape [N]
+    :param class_idx:       Class index of each box. Shape [N]
+    :param image_idx:       Index of the image each box belongs to. Shape [N]
+    :param iou_threshold:   IoU threshold for the nms algorithm
+    :return:                Indexes of the boxes to keep, sorted by decreasing score within each image.
+    """
+    if boxes.shape[0] == 0:
+        return torch.empty((0,), dtype=torch.int64, device=boxes.device)
 
-        if with_confidence:
-            pred[:, 5:] *= pred[:, 4:5]  # multiply objectness score with class score
+    # Same trade-off as torchvision's batched_nms, between a single NMS call and smaller NMS calls
+    max_boxes_per_call = 1000 if boxes.device.type == "cpu" else 20000
+    if boxes.shape[0] <= max_boxes_per_call:
+        return _nms_with_coordinate_offsets(boxes=boxes, scores=scores, class_idx=class_idx, image_idx=image_idx, iou_threshold=iou_threshold)
 
-        box = convert_cxcywh_bbox_to_xyxy(pred[:, :4])  # cxcywh to xyxy
+    idx_to_keep = []
+    for image in torch.unique(image_idx):
+        image_boxes_idx = (image_idx == image).nonzero(as_tuple=True)[0]
+        image_idx_to_keep = torchvision.ops.boxes.batched_nms(boxes[image_boxes_idx], scores[image_boxes_idx], class_idx[image_boxes_idx], iou_threshold)
+        idx_to_keep.append(image_boxes_idx[image_idx_to_keep])
+    return torch.cat(idx_to_keep)
 
-        # Detections matrix nx6 (xyxy, conf, cls)
-        if multi_label_per_box:  # try for all good confidence classes
-            i, j = (pred[:, 5:] > conf_thres).nonzero(as_tuple=False).T
-            pred = torch.cat((box[i], pred[i, j + 5, None], j[:, None].float()), 1)
 
-        else:  # best class only
-            conf, j = pred[:, 5:].max(1, keepdim=True)
-            pred = torch.cat((box, conf, j.float()), 1)[conf.view(-1) > conf_thres]
+def _nms_with_coordinate_offsets(
+    boxes: torch.Tensor, scores: torch.Tensor, class_idx: torch.Tensor, image_idx: torch.Tensor, iou_threshold: float
+) -> torch.Tensor:
+    offset = boxes.max() - boxes.min() + 1
+    offsets = torch.stack([class_idx, image_idx, class_idx, image_idx], dim=1).to(torch.float32) * offset.to(torch.float32)
+    return torchvision.ops.nms(boxes.float() + offsets, scores.float(), iou_threshold)
 
-        if not pred.shape[0]:  # If none remain process next image
-            continue
 
-        # Apply torch batched NMS algorithm
-        boxes, scores, cls_idx = pred[:, :4], pred[:, 4], pred[:, 5]
-        idx_to_keep = torchvision.ops.boxes.batched_nms(boxes, scores, cls_idx, iou_thres)
-        output[image_idx] = pred[idx_to_keep]
+def split_predictions_per_image(predictions: torch.Tensor, image_idx: torch.Tensor, batch_size: int) -> List[torch.Tensor]:
+    """Split the predictions of a batch into the predictions of each image, keeping their order within each image.
 
-    return output
+    :param predictions: Predictions of all the images. Shape [N, ...]
+    :param image_idx:   Index of the image each prediction belongs to. Shape [N]
+    :param batch_size:  Number of images in the batch.
+    :return:            Predictions of each image (possibly empty).
+    """
+    order = torch.sort(image_idx, stable=True).indices
+    n_predictions_per_image = torch.bincount(image_idx, minlength=batch_size).tolist()
+    return list(torch.split(predictions[order], n_predictions_per_image))
 
 
 def matrix_non_max_suppression(
@@ -1,4 +1,6 @@
-from typing import List, Optional, Tuple
+import queue
+import threading
+from typing import List, Optional, Tuple, Iterable, Iterator
 import cv2
 import PIL
 
@@ -9,7 +11,15 @@ from super_gradients.common.abstractions.abstract_logger import get_logger
 
 logger = get_logger(__name__)
 
-__all__ = ["load_video", "save_video", "includes_video_extension", "show_video_from_disk", "show_video_from_frames"]
+__all__ = [
+    "load_video",
+    "stream_video",
+    "get_video_properties",
+    "save_video",
+    "includes_video_extension",
+    "show_video_from_disk",
+    "show_video_from_frames",
+]
 
 VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".wmv", ".flv", ".gif")
 
@@ -30,6 +40,75 @@ def load_video(file_path: str, max_frames: Optional[int] = None) -> Tuple[List[n
     return frames, fps
 
 
+def stream_video(file_path: str, max_frames: Optional[int] = None, buffer_size: int = 64) -> Iterator[np.ndarray]:
+    """Lazily extract each frame of a video file into numpy array.
+    The frames are decoded by a background thread, ahead of the consumer, so that decoding overlaps with the processing of the previous frames.
+    Unlike `load_video`, at most `buffer_size` decoded frames are held in memory at once.
+
+    :param file_path:   Path to the video file.
+    :param max_frames:  Optional, maximum number of frames to extract.
+    :param buffer_size: Maximum number of frames decoded ahead of the consumer.
+    :return:            Iterator over the frames representing the video, each in (H, W, C), RGB.
+    """
+    cap = _open_video(file_path)
+    frames_queue = queue.Queue(maxsize=buffer_size)
+    stop_event = threading.Event()
+    end_of_video = object()
+
+    def _put(item) -> bool:
+        """Put an item in the queue, unless the consumer stopped. Return False if the consumer stopped."""
+        while not stop_event.is_set():
+            try:
+                frames_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _decode_frames() -> None:
+        try:
+            n_frames = 0
+            while max_frames != n_frames:
+                frame_read_success, frame = cap.read()
+                if not frame_read_success or not _put(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)):
+                    break
+                n_frames += 1
+        except Exception as e:
+            _put(e)
+        finally:
+            _put(end_of_video)
+
+    decoding_thread = threading.Thread(target=_decode_frames, daemon=True)
+    decoding_thread.start()
+    try:
+        while True:
+            item = frames_queue.get()
+            if item is end_of_video:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop_event.set()
+        decoding_thread.join()
+        cap.release()
+
+
+def get_video_properties(file_path: str) -> Tuple[float, int]:
+    """Get the properties of a video file, without decoding it.
+
+    :param file_path:   Path to the video file.
+    :return:
+                - Frames per Second (FPS).
+                - Number of frames, as reported by the video container. This may be approximate, depending on the video format.
+    """
+    cap = _open_video(file_path)
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    n_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+    return fps, n_frames
+
+
 def _open_video(file_path: str) -> cv2.VideoCapture:
     """Open a video file.
 
@@ -61,7 +140,7 @@ def _extract_frames(cap: cv2.VideoCapture, max_frames: Optional[int] = None) ->
     return frames
 
 
-def save_video(output_path: str, frames: List[np.ndarray], fps: int) -> None:
+def save_video(output_path: str, frames: Iterable[np.ndarray], fps: int) -> None:
     """Save a video locally. Depending on the extension, the video will be saved as a .mp4 file or as a .gif file.
 
     :param output_path: Where the video will be saved
@@ -78,7 +157,7 @@ def save_video(output_path: str, frames: List[np.ndarray], fps: int) -> None:
         save_mp4(output_path, frames, fps)
 
 
-def save_gif(output_path: str, frames: List[np.ndarray], fps: int) -> None:
+def save_gif(output_path: str, frames: Iterable[np.ndarray], fps: int) -> None:
     """Save a video locally in .gif format.
 
     :param output_path: Where the video will be saved
@@ -91,14 +170,20 @@ def save_gif(output_path: str, frames: List[np.ndarray], fps: int) -> None:
     frames_pil[0].save(output_path, save_all=True, append_images=frames_pil[1:], duration=int(1000 / fps), loop=0)
 
 
-def save_mp4(output_path: str, frames: List[np.ndarray], fps: int) -> None:
+def save_mp4(output_path: str, frames: Iterable[np.ndarray], fps: int) -> None:
     """Save a video locally in .mp4 format.
+    The frames are written one by one, so that they can be generated lazily without holding the whole video in memory.
 
     :param output_path: Where the video will be saved
     :param frames:      Frames representing the video, each in (H, W, C), RGB. Note that all the frames are expected to have the same shape.
     :param fps:         Frames per second
     """
-    video_height, video_width = _validate_frames(frames)
+    frames = iter(frames)
+    first_frame = next(frames, None)
+    if first_frame is None:
+        raise RuntimeError("Cannot save a video without any frame.")
+
+    video_height, video_width = _validate_frame(first_frame)
 
     video_writer = cv2.VideoWriter(
         output_path,
@@ -107,34 +192,28 @@ def save_mp4(output_path: str, frames: List[np.ndarray], fps: int) -> None:
         (video_width, video_height),
     )
 
-    for frame in frames:
-        video_writer.write(cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
-
-    video_writer.release()
+    try:
+        video_writer.write(cv2.cvtColor(first_frame, cv2.COLOR_RGB2BGR))
+        for frame in frames:
+            if _validate_frame(frame) != (video_height, video_width):
+                raise RuntimeError(
+                    f"Your video is made of frames that have different (height, width): ({video_height}, {video_width}) and {frame.shape[:2]}.\n"
+                    f"Please make sure that all the frames have the same shape."
+                )
+            video_writer.write(cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
+    finally:
+        video_writer.release()
 
 
-def _validate_frames(frames: List[np.ndarray]) -> Tuple[float, float]:
-    """Validate the frames to make sure that every frame has the same size and includes the channel dimension. (i.e. (H, W, C))
+def _validate_frame(frame: np.ndarray) -> Tuple[int, int]:
+    """Validate that a frame includes the channel dimension. (i.e. (H, W, C))
 
-    :param frames:  Frames representing the video, each in (H, W, C), RGB. Note that all the frames are expected to have the same shape.
-    :return:        (Height, Weight) of the video.
+    :param frame:   Frame, in (H, W, C), RGB.
+    :return:        (Height, Width) of the frame.
     """
-    min_height = min(frame.shape[0] for frame in frames)
-    max_height = max(frame.shape[0] for frame in frames)
-
-    min_width = min(frame.shape[1] for frame in frames)
-    max_width = max(frame.shape[1] for frame in frames)
-
-    if (min_height, min_width) != (max_height, max_width):
-        raise RuntimeError(
-            f"Your video is made of frames that have (height, width) going from ({min_height}, {min_width}) to ({max_height}, {max_width}).\n"
-            f"Please make sure that all the frames have the same shape."
-        )
-
-    if set(frame.ndim for frame in frames) != {3} or set(frame.shape[-1] for frame in frames) != {3}:
+    if frame.ndim != 3 or frame.shape[-1] != 3:
         raise RuntimeError("Your frames must include 3 channels.")
-
-    return max_height, max_width
+    return frame.shape[0], frame.shape[1]
 
 
 def show_video_from_disk(video_path: str, window_name: str = "Prediction"):
@@ -165,7 +244,7 @@ def show_video_from_disk(video_path: str, window_name: str = "Prediction"):
     cv2.waitKey(1)
 
 
-def show_video_from_frames(frames: List[np.ndarray], fps: float, window_name: str = "Prediction") -> None:
+def show_video_from_frames(frames: Iterable[np.ndarray], fps: float, window_name: str = "Prediction") -> None:
     """Display a video from a list of frames using OpenCV.
 
     :param frames:      Frames representing the video, each in (H, W, C), RGB. Note that all the frames are expected to have the same shape.
@@ -1,6 +1,6 @@
 import os
 from dataclasses import dataclass
-from typing import List
+from typing import List, Iterator
 
 import numpy as np
 
@@ -240,8 +240,29 @@ class VideoPoseEstimationPrediction(VideoPredictions):
 
         :return:                List of images with predicted bboxes. Note that this does not modify the original image.
         """
-        frames_with_bbox = [
-            result.draw(
+        return list(
+            self._draw_frames(
+                edge_colors=edge_colors,
+                joint_thickness=joint_thickness,
+                keypoint_colors=keypoint_colors,
+                keypoint_radius=keypoint_radius,
+                box_thickness=box_thickness,
+                show_confidence=show_confidence,
+            )
+        )
+
+    def _draw_frames(
+        self,
+        edge_colors=None,
+        joint_thickness: int = 2,
+        keypoint_colors=None,
+        keypoint_radius: int = 5,
+        box_thickness: int = 2,
+        show_confidence: bool = False,
+    ) -> Iterator[np.ndarray]:
+        """Lazily draw the predicted poses on the images, so that the frames can be consumed one by one without holding all of them in memory."""
+        for result in self._images_prediction_lst:
+            yield result.draw(
                 edge_colors=edge_colors,
                 joint_thickness=joint_thickness,
                 keypoint_colors=keypoint_colors,
@@ -249,9 +270,6 @@ class VideoPoseEstimationPrediction(VideoPredictions):
                 box_thickness=box_thickness,
                 show_confidence=show_confidence,
             )
-            for result in self._images_prediction_lst
-        ]
-        return frames_with_bbox
 
     def show(
         self,
@@ -275,7 +293,7 @@ class VideoPoseEstimationPrediction(VideoPredictions):
         :param show_confidence: Whether to show confidence scores on the image.
         :param box_thickness:   Thickness of bounding boxes.
         """
-        frames = self.draw(
+        frames = self._draw_frames(
             edge_colors=edge_colors,
             joint_thickness=joint_thickness,
             keypoint_colors=keypoint_colors,
@@ -309,7 +327,7 @@ class VideoPoseEstimationPrediction(VideoPredictions):
         :param show_confidence: Whether to show confidence scores on the image.
         :param box_thickness:   Thickness of bounding boxes.
         """
-        frames = self.draw(
+        frames = self._draw_frames(
             edge_colors=edge_colors,
             joint_thickness=joint_thickness,
             keypoint_colors=keypoint_colors,
@@ -297,10 +297,14 @@ class VideoDetectionPrediction(VideoPredictions):
                                 Default is None, which generates a default color mapping based on the number of class names.
         :return:                List of images with predicted bboxes. Note that this does not modify the original image.
         """
-        frames_with_bbox = [
-            result.draw(box_thickness=box_thickness, show_confidence=show_confidence, color_mapping=color_mapping) for result in self._images_prediction_lst
-        ]
-        return frames_with_bbox
+        return list(self._draw_frames(box_thickness=box_thickness, show_confidence=show_confidence, color_mapping=color_mapping))
+
+    def _draw_frames(
+        self, box_thickness: int = 2, show_confidence: bool = True, color_mapping: Optional[List[Tuple[int, int, int]]] = None
+    ) -> Iterator[np.ndarray]:
+        """Lazily draw the predicted bboxes on the images, so that the frames can be consumed one by one without holding all of them in memory."""
+        for result in self._images_prediction_lst:
+            yield result.draw(box_thickness=box_thickness, show_confidence=show_confidence, color_mapping=color_mapping)
 
     def show(self, box_thickness: int = 2, show_confidence: bool = True, color_mapping: Optional[List[Tuple[int, int, int]]] = None) -> None:
         """Display the predicted bboxes on the images.
@@ -310,7 +314,7 @@ class VideoDetectionPrediction(VideoPredictions):
         :param color_mapping:   List of tuples representing the colors for each class.
                                 Default is None, which generates a default color mapping based on the number of class names.
         """
-        frames = self.draw(box_thickness=box_thickness, show_confidence=show_confidence, color_mapping=color_mapping)
+        frames = self._draw_frames(box_thickness=box_thickness, show_confidence=show_confidence, color_mapping=color_mapping)
         show_video_from_frames(window_name="Detection", frames=frames, fps=self.fps)
 
     def save(self, output_path: str, box_thickness: int = 2, show_confidence: bool = True, color_mapping: Optional[List[Tuple[int, int, int]]] = None) -> None:
@@ -322,5 +326,5 @@ class VideoDetectionPrediction(VideoPredictions):
         :param color_mapping:   List of tuples representing the colors for each class.
                                 Default is None, which generates a default color mapping based on the number of class names.
         """
-        frames = self.draw(box_thickness=box_thickness, show_confidence=show_confidence, color_mapping=color_mapping)
+        frames = self._draw_frames(box_thickness=box_thickness, show_confidence=show_confidence, color_mapping=color_mapping)
         save_video(output_path=output_path, frames=frames, fps=self.fps)
@@ -238,6 +238,26 @@ def tensor_container_to_device(obj: Union[torch.Tensor, tuple, list, dict], devi
         return obj
 
 
+def float_tensor_container_to_dtype(obj: Union[torch.Tensor, tuple, list, dict], dtype: torch.dtype):
+    """
+    recursively cast the floating point tensors of compounded objects to dtype (maintaining structure)
+        :param obj:     the object to cast (list / tuple / tensor / dict)
+        :param dtype:   floating point dtype to cast the tensors to
+        :returns        an object with the same structure (tensors, lists, tuples), where the floating point tensors were cast to dtype.
+                        Non floating point tensors (e.g. indices) are returned as is.
+    """
+    if isinstance(obj, torch.Tensor):
+        return obj.to(dtype) if obj.is_floating_point() else obj
+    elif isinstance(obj, tuple):
+        return tuple(float_tensor_container_to_dtype(x, dtype) for x in obj)
+    elif isinstance(obj, list):
+        return [float_tensor_container_to_dtype(x, dtype) for x in obj]
+    elif isinstance(obj, dict):
+        return {k: float_tensor_container_to_dtype(v, dtype) for k, v in obj.items()}
+    else:
+        return obj
+
+
 def fuzzy_keys(params: Mapping) -> List[str]:
     """
     Returns params.key() removing leading and trailing white space, lower-casing and dropping symbols.
@@ -23,7 +23,7 @@ from tests.unit_tests import (
     TestTransforms,
 )
 from tests.end_to_end_tests import TestTrainer
-from tests.unit_tests.detection_utils_test import TestDetectionUtils
+from tests.unit_tests.detection_utils_test import TestDetectionUtils, TestNonMaxSuppression
 from tests.unit_tests.detection_dataset_test import DetectionDatasetTest
 from tests.unit_tests.export_onnx_test import TestModelsONNXExport
 from tests.unit_tests.load_checkpoint_test import LoadCheckpointTest
@@ -66,6 +66,7 @@ from tests.unit_tests.repvgg_block_tests import TestRepVGGBlock
 from tests.unit_tests.training_utils_test import TestTrainingUtils
 from tests.unit_tests.dekr_loss_test import DEKRLossTest
 from tests.unit_tests.pose_estimation_metrics_test import TestPoseEstimationMetrics
+from tests.unit_tests.video_utils_test import TestVideoUtils
 
 
 class CoreUnitTestSuiteRunner:
@@ -99,6 +100,8 @@ class CoreUnitTestSuiteRunner:
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TestConvBnRelu))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(FactoriesTest))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TestDetectionUtils))
+        self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TestNonMaxSuppression))
+        self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TestVideoUtils))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(DiceLossTest))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TestViT))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(KDEMATest))
@@ -3,14 +3,22 @@ import unittest
 
 import numpy as np
 import torch.cuda
+import torchvision
 
 from super_gradients.common.object_names import Models
 from super_gradients.training import Trainer, utils as core_utils, models
 from super_gradients.training.dataloaders.dataloaders import coco2017_val
 from super_gradients.training.datasets.datasets_conf import COCO_DETECTION_CLASSES_LIST
 from super_gradients.training.metrics import DetectionMetrics, DetectionMetrics_050
+from super_gradients.training.models.detection_models.pp_yolo_e import PPYoloEPostPredictionCallback
 from super_gradients.training.models.detection_models.yolo_base import YoloPostPredictionCallback
-from super_gradients.training.utils.detection_utils import DetectionVisualization
+from super_gradients.training.utils.detection_utils import (
+    DetectionVisualization,
+    convert_cxcywh_bbox_to_xyxy,
+    non_max_suppression,
+    nms_per_image_and_class,
+    split_predictions_per_image,
+)
 from tests.core_test_utils import is_data_available
 
 
@@ -75,5 +83,121 @@ class TestDetectionUtils(unittest.TestCase):
             self.assertTrue(np.allclose(values, ref_val, rtol=1e-3, atol=1e-4))
 
 
+class TestNonMaxSuppression(unittest.TestCase):
+    """Compare the NMS applied to the whole batch at once with NMS applied image by image."""
+
+    def setUp(self):
+        torch.manual_seed(0)
+
+    def assertPredictionsEqual(self, predictions, expected_predictions):
+        self.assertEqual(len(predictions), len(expected_predictions))
+        for image_predictions, expected_image_predictions in zip(predictions, expected_predictions):
+            if expected_image_predictions is None:
+                self.assertIsNone(image_predictions)
+                continue
+            # Boxes with exactly the same score can be kept in any order
+            self.assertTrue(torch.equal(image_predictions[:, 4], expected_image_predictions[:, 4]))
+            self.assertEqual(sorted(map(tuple, image_predictions.tolist())), sorted(map(tuple, expected_image_predictions.tolist())))
+
+    def _get_yolo_prediction(self, batch_size: int, n_anchors: int, n_classes: int) -> torch.Tensor:
+        prediction = torch.rand(batch_size, n_anchors, 5 + n_classes)
+        prediction[..., :2] *= 640
+        prediction[..., 2:4] = prediction[..., 2:4] * 100 + 5
+        prediction[1, :, 4] = 0  # The second image has no candidate
+        return prediction
+
+    def _per_image_non_max_suppression(self, prediction, conf_thres, iou_thres, multi_label_per_box, with_confidence):
+        output = [None] * prediction.shape[0]
+        for image_idx, pred in enumerate(prediction):
+            pred = pred[pred[:, 4] > conf_thres]
+            if with_confidence:
+                pred[:, 5:] *= pred[:, 4:5]
+            box = convert_cxcywh_bbox_to_xyxy(pred[:, :4])
+            if multi_label_per_box:
+                i, j = (pred[:, 5:] > conf_thres).nonzero(as_tuple=False).T
+                pred = torch.cat((box[i], pred[i, j + 5, None], j[:, None].float()), 1)
+            else:
+                conf, j = pred[:, 5:].max(1, keepdim=True)
+                pred = torch.cat((box, conf, j.float()), 1)[conf.view(-1) > conf_thres]
+            if pred.shape[0]:
+                output[image_idx] = pred[torchvision.ops.batched_nms(pred[:, :4], pred[:, 4], pred[:, 5], iou_thres)]
+        return output
+
+    def _per_image_ppyoloe_post_prediction(self, pred_bboxes, pred_scores, score_threshold, nms_threshold, nms_top_k, multi_label_per_box):
+        output = []
+        for image_bboxes, image_scores in zip(pred_bboxes, pred_scores):
+            if multi_label_per_box:
+                i, labels = (image_scores > score_threshold).nonzero(as_tuple=False).T
+                bboxes, scores = image_bboxes[i], image_scores[i, labels]
+            else:
+                scores, labels = torch.max(image_scores, dim=1)
+                mask = scores >= score_threshold
+                bboxes, scores, labels = image_bboxes[mask], scores[mask], labels[mask]
+            if scores.shape[0] > nms_top_k:
+                topk_candidates = torch.topk(scores, k=nms_top_k).indices
+                bboxes, scores, labels = bboxes[topk_candidates], scores[topk_candidates], labels[topk_candidates]
+            idx_to_keep = torchvision.ops.batched_nms(bboxes, scores, labels, nms_threshold)
+            output.append(torch.cat([bboxes[idx_to_keep], scores[idx_to_keep, None], labels[idx_to_keep, None]], dim=1))
+        return output
+
+    def test_non_max_suppression_matches_per_image_nms(self):
+        prediction = self._get_yolo_prediction(batch_size=3, n_anchors=200, n_classes=10)
+        for multi_label_per_box in (True, False):
+            for with_confidence in (True, False):
+                predictions = non_max_suppression(prediction.clone(), 0.3, 0.5, multi_label_per_box, with_confidence)
+                expected_predictions = self._per_image_non_max_suppression(prediction.clone(), 0.3, 0.5, multi_label_per_box, with_confidence)
+                self.assertIsNone(predictions[1])
+                self.assertPredictionsEqual(predictions, expected_predictions)
+
+    def test_non_max_suppression_without_candidates(self):
+        prediction = self._get_yolo_prediction(batch_size=2, n_anchors=50, n_classes=5)
+        prediction[..., 4] = 0
+        self.assertEqual(non_max_suppression(prediction, 0.3, 0.5), [None, None])
+
+    def test_non_max_suppression_above_single_call_threshold(self):
+        # More than 1000 boxes on CPU, so that NMS is applied image by image
+        prediction = self._get_yolo_prediction(batch_size=3, n_anchors=1000, n_classes=10)
+        predictions = non_max_suppression(prediction.clone(), 0.2, 0.5, with_confidence=False)
+        expected_predictions = self._per_image_non_max_suppression(prediction.clone(), 0.2, 0.5, True, False)
+        self.assertGreater(sum(len(image_predictions) for image_predictions in expected_predictions if image_predictions is not None), 1000)
+        self.assertPredictionsEqual(predictions, expected_predictions)
+
+    def test_nms_per_image_and_class_matches_batched_nms(self):
+        for n_boxes in (500, 3000):  # Single NMS call, and NMS applied image by image
+            boxes = torch.rand(n_boxes, 4) * 600
+            boxes[:, 2:] += boxes[:, :2]
+            scores = torch.rand(n_boxes)
+            class_idx = torch.randint(0, 10, (n_boxes,))
+            image_idx = torch.randint(0, 4, (n_boxes,))
+
+            idx_to_keep = nms_per_image_and_class(boxes, scores, class_idx, image_idx, iou_threshold=0.5)
+            expected_idx_to_keep = torchvision.ops.batched_nms(boxes, scores, image_idx * 10 + class_idx, iou_threshold=0.5)
+            self.assertEqual(set(idx_to_keep.tolist()), set(expected_idx_to_keep.tolist()))
+            for image in range(4):
+                image_scores = scores[idx_to_keep[image_idx[idx_to_keep] == image]]
+                self.assertTrue(torch.all(image_scores[:-1] >= image_scores[1:]))
+
+    def test_split_predictions_per_image(self):
+        predictions = torch.arange(6, dtype=torch.float32)[:, None]
+        image_idx = torch.tensor([2, 0, 2, 0, 0, 2])
+        split_predictions = split_predictions_per_image(predictions, image_idx, batch_size=4)
+        self.assertEqual([image_predictions.view(-1).tolist() for image_predictions in split_predictions], [[1, 3, 4], [], [0, 2, 5], []])
+
+    def test_ppyoloe_post_prediction_callback_matches_per_image_nms(self):
+        pred_bboxes = convert_cxcywh_bbox_to_xyxy(self._get_yolo_prediction(batch_size=4, n_anchors=300, n_classes=1)[..., :4])
+        pred_scores = torch.rand(4, 300, 10) ** 4
+        pred_scores[1] = 0  # Image without candidate
+        pred_scores[2, 10:] = 0  # Image with less candidates than nms_top_k, while the others have more
+        for multi_label_per_box in (True, False):
+            callback = PPYoloEPostPredictionCallback(
+                score_threshold=0.25, nms_threshold=0.5, nms_top_k=50, max_predictions=1000, multi_label_per_box=multi_label_per_box
+            )
+            predictions = callback(((pred_bboxes, pred_scores), None), device="cpu")
+            expected_predictions = self._per_image_ppyoloe_post_prediction(pred_bboxes, pred_scores, 0.25, 0.5, 50, multi_label_per_box)
+            self.assertEqual(predictions[1].shape, (0, 6))
+            self.assertLess(int((pred_scores[2] > 0.25).sum()), 50)
+            self.assertPredictionsEqual(predictions, expected_predictions)
+
+
 if __name__ == "__main__":
     unittest.main()
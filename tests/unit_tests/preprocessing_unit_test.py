@@ -1,13 +1,26 @@
 import os
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+import torch
+
 from super_gradients import Trainer
 from super_gradients.training import models
 from super_gradients.training.datasets import COCODetectionDataset
 from super_gradients.training.metrics import DetectionMetrics
 from super_gradients.training.models import YoloPostPredictionCallback
-from super_gradients.training.processing import ReverseImageChannels, DetectionLongestMaxSizeRescale, DetectionBottomRightPadding, ImagePermute
+from super_gradients.training.processing import (
+    ReverseImageChannels,
+    DetectionLongestMaxSizeRescale,
+    DetectionBottomRightPadding,
+    ImagePermute,
+    ComposeProcessing,
+    GPUComposeProcessing,
+    StandardizeImage,
+    NormalizeImage,
+)
 from super_gradients.training.utils.detection_utils import DetectionCollateFN, CrowdDetectionCollateFN
 from super_gradients.training import dataloaders
 
@@ -176,6 +189,93 @@ class PreprocessingUnitTest(unittest.TestCase):
         self.assertEqual(model._default_nms_iou, 0.65)
         self.assertEqual(model._default_nms_conf, 0.5)
 
+    def test_preprocess_images_matches_preprocess_image(self):
+        image_processor = ComposeProcessing(
+            [
+                ReverseImageChannels(),
+                DetectionLongestMaxSizeRescale(output_shape=(64, 64)),
+                DetectionBottomRightPadding(output_shape=(64, 64), pad_value=114),
+                StandardizeImage(),
+                ImagePermute(),
+            ]
+        )
+        images = [np.random.randint(0, 255, size=(h, w, 3), dtype=np.uint8) for h, w in [(48, 64), (100, 30), (64, 64)]]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for processing_executor in (None, executor):
+                processed_images, metadata_lst = image_processor.preprocess_images(images, executor=processing_executor)
+
+                self.assertEqual(processed_images.shape, (3, 3, 64, 64))
+                self.assertEqual(len(metadata_lst), 3)
+                for image, processed_image, metadata in zip(images, processed_images, metadata_lst):
+                    expected_image, expected_metadata = image_processor.preprocess_image(image)
+                    np.testing.assert_allclose(processed_image, expected_image)
+                    self.assertEqual(metadata, expected_metadata)
+
+    def test_gpu_compose_processing_matches_compose_processing(self):
+        processings = [
+            DetectionLongestMaxSizeRescale(output_shape=(64, 64)),
+            DetectionBottomRightPadding(output_shape=(64, 64), pad_value=114),
+            ReverseImageChannels(),
+            StandardizeImage(),
+            NormalizeImage(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225]),
+            ImagePermute(),
+        ]
+        images = [np.random.randint(0, 255, size=(h, w, 3), dtype=np.uint8) for h, w in [(48, 64), (100, 30)]]
+
+        expected_images, expected_metadata_lst = ComposeProcessing(processings).preprocess_images(images)
+
+        gpu_image_processor = GPUComposeProcessing(processings)
+        host_images, metadata_lst = gpu_image_processor.preprocess_images(images)
+        processed_images = gpu_image_processor.preprocess_images_tensor(torch.from_numpy(host_images))
+
+        self.assertEqual(host_images.dtype, np.uint8)
+        self.assertEqual(metadata_lst, expected_metadata_lst)
+        np.testing.assert_allclose(processed_images.numpy(), expected_images, rtol=1e-5, atol=1e-5)
+
+    def test_compose_processing_fuses_pixel_value_processings(self):
+        processings = [
+            ReverseImageChannels(),
+            StandardizeImage(),
+            NormalizeImage(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225]),
+            ImagePermute(),
+        ]
+        image = np.random.randint(0, 255, size=(48, 64, 3), dtype=np.uint8)
+
+        expected_image = image
+        for processing in processings:
+            expected_image, _ = processing.preprocess_image(expected_image)
+        processed_image, metadata = ComposeProcessing(processings).preprocess_image(image)
+
+        self.assertEqual(processed_image.dtype, expected_image.dtype)
+        np.testing.assert_array_equal(processed_image, expected_image)
+        self.assertEqual(metadata.metadata_lst, [None] * len(processings))
+
+    def test_compose_processing_single_channel_image(self):
+        processings = [
+            StandardizeImage(),
+            NormalizeImage(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225]),
+            ImagePermute(),
+        ]
+        for n_channels in (1, 3):
+            with self.subTest(n_channels=n_channels):
+                image = np.random.randint(0, 255, size=(48, 64, n_channels), dtype=np.uint8)
+
+                expected_image = image
+                for processing in processings:
+                    expected_image, _ = processing.preprocess_image(expected_image)
+                processed_image, _ = ComposeProcessing(processings).preprocess_image(image)
+
+                self.assertEqual(processed_image.shape, (3, 48, 64))
+                np.testing.assert_array_equal(processed_image, expected_image)
+
+        # Single channel normalization, keeping the single channel
+        processings = [StandardizeImage(), NormalizeImage(mean=[0.5], std=[0.25]), ImagePermute()]
+        image = np.random.randint(0, 255, size=(48, 64, 1), dtype=np.uint8)
+        processed_image, _ = ComposeProcessing(processings).preprocess_image(image)
+        self.assertEqual(processed_image.shape, (1, 48, 64))
+        np.testing.assert_allclose(processed_image, (image.transpose(2, 0, 1) / 255.0 - 0.5) / 0.25, rtol=1e-5, atol=1e-5)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -15,6 +15,7 @@ from super_gradients.training.transforms.utils import (
     _rescale_image,
     _rescale_bboxes,
     _pad_image,
+    _can_pad_with_opencv,
     _shift_bboxes,
     _rescale_and_pad_to_size,
     _rescale_xyxy_bboxes,
@@ -218,6 +219,39 @@ class TestTransforms(unittest.TestCase):
         padded_image = _pad_image(image=image, padding_coordinates=padding_coordinates, pad_value=0)
         np.testing.assert_array_equal(padded_image, expected_padded_image)
 
+    def test_pad_image_opencv_matches_numpy(self):
+        """cv2.copyMakeBorder should give exactly the same output as np.pad for all the images it is used on."""
+        padding_coordinates = PaddingCoordinates(top=3, bottom=5, left=2, right=7)
+        pad_value = 114
+        pad_h = (padding_coordinates.top, padding_coordinates.bottom)
+        pad_w = (padding_coordinates.left, padding_coordinates.right)
+
+        for dtype in (np.uint8, np.float32):
+            for shape in ((20, 30), (20, 30, 2), (20, 30, 3), (20, 30, 4)):
+                for contiguous in (True, False):
+                    with self.subTest(dtype=dtype, shape=shape, contiguous=contiguous):
+                        image = (np.random.rand(*shape) * 255).astype(dtype)
+                        if not contiguous:
+                            image = image[..., ::-1]
+                            self.assertFalse(image.flags["C_CONTIGUOUS"])
+
+                        self.assertTrue(_can_pad_with_opencv(image, pad_value))
+                        expected_padded_image = np.pad(image, (pad_h, pad_w) + ((0, 0),) * (image.ndim - 2), "constant", constant_values=pad_value)
+                        padded_image = _pad_image(image=image, padding_coordinates=padding_coordinates, pad_value=pad_value)
+
+                        self.assertEqual(padded_image.dtype, expected_padded_image.dtype)
+                        np.testing.assert_array_equal(padded_image, expected_padded_image)
+
+    def test_pad_image_falls_back_to_numpy(self):
+        """Images OpenCV can not pad like np.pad (single channel, more than 4 channels, unsupported dtype) should keep their shape and dtype."""
+        padding_coordinates = PaddingCoordinates(top=1, bottom=2, left=3, right=4)
+        for image in (np.ones((10, 12, 1), dtype=np.uint8), np.ones((10, 12, 5), dtype=np.uint8), np.ones((10, 12, 3), dtype=np.int64)):
+            with self.subTest(shape=image.shape, dtype=image.dtype):
+                self.assertFalse(_can_pad_with_opencv(image, 0))
+                padded_image = _pad_image(image=image, padding_coordinates=padding_coordinates, pad_value=0)
+                self.assertEqual(padded_image.shape, (13, 19, image.shape[2]))
+                self.assertEqual(padded_image.dtype, image.dtype)
+
     def test_get_padding_coordinates(self):
         # Test Case 1: Width padding required
         image = np.zeros((640, 480))
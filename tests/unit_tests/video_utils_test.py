@@ -0,0 +1,72 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import cv2
+import numpy as np
+
+from super_gradients.training.utils.media import video
+from super_gradients.training.utils.media.video import load_video, stream_video, get_video_properties
+
+
+class TestVideoUtils(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.video_path = os.path.join(self.tmp_dir.name, "video.mp4")
+        self.n_frames, self.fps = 12, 10
+
+        writer = cv2.VideoWriter(self.video_path, cv2.VideoWriter_fourcc(*"mp4v"), self.fps, (64, 48))
+        for i in range(self.n_frames):
+            writer.write(np.full((48, 64, 3), fill_value=i * 20, dtype=np.uint8))
+        writer.release()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_stream_video_matches_load_video(self):
+        expected_frames, _ = load_video(self.video_path)
+        frames = list(stream_video(self.video_path, buffer_size=2))
+
+        self.assertEqual(len(frames), self.n_frames)
+        self.assertEqual(len(frames), len(expected_frames))
+        for frame, expected_frame in zip(frames, expected_frames):
+            np.testing.assert_array_equal(frame, expected_frame)
+
+    def test_stream_video_max_frames(self):
+        expected_frames, _ = load_video(self.video_path, max_frames=5)
+        frames = list(stream_video(self.video_path, max_frames=5))
+
+        self.assertEqual(len(frames), 5)
+        for frame, expected_frame in zip(frames, expected_frames):
+            np.testing.assert_array_equal(frame, expected_frame)
+
+    def test_stream_video_closed_early(self):
+        """Closing the stream before the end of the video should stop the decoding thread and release the video capture."""
+        opened_captures = []
+
+        def _open_video(file_path: str) -> cv2.VideoCapture:
+            cap = cv2.VideoCapture(file_path)
+            opened_captures.append(cap)
+            return cap
+
+        n_threads = threading.active_count()
+        with mock.patch.object(video, "_open_video", side_effect=_open_video):
+            frames = stream_video(self.video_path, buffer_size=2)
+            next(frames)
+            self.assertEqual(threading.active_count(), n_threads + 1)
+            frames.close()
+
+        self.assertEqual(threading.active_count(), n_threads)
+        self.assertEqual(len(opened_captures), 1)
+        self.assertFalse(opened_captures[0].isOpened())
+
+    def test_get_video_properties(self):
+        fps, n_frames = get_video_properties(self.video_path)
+        self.assertEqual(fps, self.fps)
+        self.assertEqual(n_frames, self.n_frames)
+
+
+if __name__ == "__main__":
+    unittest.main()
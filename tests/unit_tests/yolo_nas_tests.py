@@ -1,9 +1,11 @@
 import unittest
 
+import numpy as np
 import torch
 
 from super_gradients.common.object_names import Models
 from super_gradients.training import models
+from super_gradients.training.processing.processing import default_yolo_nas_coco_processing_params
 
 
 class TestYOLONAS(unittest.TestCase):
@@ -17,6 +19,53 @@ class TestYOLONAS(unittest.TestCase):
         model = models.get(Models.YOLO_NAS_S, arch_params=dict(in_channels=2), num_classes=17)
         model(torch.rand(1, 2, 640, 640))
 
+    def test_yolo_nas_predict_restores_train_mode(self):
+        """
+        Validate that predicting a single image does not leave the model in evaluation mode.
+        """
+        model = models.get(Models.YOLO_NAS_S, num_classes=80)
+        model.set_dataset_processing_params(**default_yolo_nas_coco_processing_params())
+        image = np.random.randint(0, 255, size=(320, 320, 3), dtype=np.uint8)
+
+        model.train()
+        model.predict(image, fuse_model=False)
+        self.assertTrue(model.training)
+
+        model.eval()
+        model.predict(image, fuse_model=False)
+        self.assertFalse(model.training)
+
+    def test_yolo_nas_predict_with_workers_matches_single_process(self):
+        """
+        Validate that preprocessing the batches in DataLoader workers gives the same predictions, including for a last batch that is not full.
+        """
+        model = models.get(Models.YOLO_NAS_S, num_classes=80)
+        model.set_dataset_processing_params(**default_yolo_nas_coco_processing_params())
+        images = [np.random.randint(0, 255, size=(h, w, 3), dtype=np.uint8) for h, w in [(320, 320), (240, 320), (320, 200), (100, 150), (320, 320)]]
+
+        expected_predictions = model._get_pipeline(conf=0.01, fuse_model=False, num_workers=0)(images, batch_size=2)
+        predictions = model._get_pipeline(conf=0.01, fuse_model=False, num_workers=2)(images, batch_size=2)
+
+        self.assertEqual(len(predictions), len(images))
+        for image_prediction, expected_image_prediction in zip(predictions, expected_predictions):
+            np.testing.assert_array_equal(image_prediction.image, expected_image_prediction.image)
+            np.testing.assert_array_equal(image_prediction.prediction.bboxes_xyxy, expected_image_prediction.prediction.bboxes_xyxy)
+            np.testing.assert_array_equal(image_prediction.prediction.confidence, expected_image_prediction.prediction.confidence)
+            np.testing.assert_array_equal(image_prediction.prediction.labels, expected_image_prediction.prediction.labels)
+
+    def test_yolo_nas_predict_without_fusing_uses_model(self):
+        """
+        Validate that predicting with fuse_model=False runs the user's model itself, even where channels last memory layout would be used (CUDA).
+        """
+        model = models.get(Models.YOLO_NAS_S, num_classes=80)
+        model.set_dataset_processing_params(**default_yolo_nas_coco_processing_params())
+        image = np.random.randint(0, 255, size=(320, 320, 3), dtype=np.uint8)
+
+        pipeline = model._get_pipeline(fuse_model=False)
+        pipeline._supports_channels_last = True
+        pipeline(image)
+        self.assertIs(pipeline.model, model)
+
 
 if __name__ == "__main__":
     unittest.main()